@@ -19,152 +19,110 @@ __maintainer__  = 'RedWishkers Vfx Studio'
 
 
 
-# Core navigation components
-from .routing import (
-    RouteCatalog,
-    RouteSource,
-    navigate,
-    setup_navigator,
-    RouteManager
-)
-
-from .navigation import UIVoyager
-
-# Professional interfaces
-from .interfaces import (
-    IRouteValidator,
-    INavigationInterceptor,
-    IUILifecycleManager,
-    IRouteRegistry,
-    IGUIFrameworkAdapter,
-    IWidgetWrapper
-)
-
-# Validation system
-from .validation import (
-    RouteValidator,
-    SecurityValidator,
-    route_validator,
-    security_validator
-)
-
-# Exception system
-from .exceptions import (
-    NavixError,
-    NavigationError,
-    RouteError,
-    RouteNotFoundError,
-    RouteConflictError,
-    FrameworkError,
-    ValidationError
-)
-
-# Data container system
-from .data_container import (
-    RouteDataContainer,
-    ModuleDataContainer,
-    DataContainerManager,
-    ContainerStatus,
-    ContainerData,
-    container_manager,
-    container_property,
-    auto_container,
-    DataReference
-)
-
-# Builder system for elegant configuration
-from .builders import (
-    NavixAppBuilder,
-    Navix_app,
-    NavigationBuilder,
-    ValidationBuilder, 
-    InterceptorBuilder,
-    ContainerBuilder,
-    navigation,
-    validation,
-    interceptors,
-    containers
-)
-
-# RBAC manager
-from .security.rbac import (
-    rbac_manager
-)
+# standard library imports
+import importlib
+
+# public name -> (relative module, attribute); resolved on first access (PEP 562)
+_LAZY = {
+    # Core navigation components
+    'RouteCatalog'           : ('.routing', 'RouteCatalog'),
+    'RouteSource'            : ('.routing', 'RouteSource'),
+    'navigate'               : ('.routing', 'navigate'),
+    'register_lazy'          : ('.routing', 'register_lazy'),
+    'setup_navigator'        : ('.routing', 'setup_navigator'),
+    'RouteManager'           : ('.routing', 'RouteManager'),
+    'UIVoyager'              : ('.navigation', 'UIVoyager'),
 
+    # Professional interfaces
+    'IRouteValidator'        : ('.interfaces', 'IRouteValidator'),
+    'INavigationInterceptor' : ('.interfaces', 'INavigationInterceptor'),
+    'IUILifecycleManager'    : ('.interfaces', 'IUILifecycleManager'),
+    'IRouteRegistry'         : ('.interfaces', 'IRouteRegistry'),
+    'IGUIFrameworkAdapter'   : ('.interfaces', 'IGUIFrameworkAdapter'),
+    'IWidgetWrapper'         : ('.interfaces', 'IWidgetWrapper'),
+
+    # Validation system
+    'RouteValidator'         : ('.validation', 'RouteValidator'),
+    'SecurityValidator'      : ('.validation', 'SecurityValidator'),
+    'route_validator'        : ('.validation', 'route_validator'),
+    'security_validator'     : ('.validation', 'security_validator'),
 
+    # Exception system
+    'NavixError'             : ('.exceptions', 'NavixError'),
+    'NavigationError'        : ('.exceptions', 'NavigationError'),
+    'RouteError'             : ('.exceptions', 'RouteError'),
+    'RouteNotFoundError'     : ('.exceptions', 'RouteNotFoundError'),
+    'RouteConflictError'     : ('.exceptions', 'RouteConflictError'),
+    'FrameworkError'         : ('.exceptions', 'FrameworkError'),
+    'ValidationError'        : ('.exceptions', 'ValidationError'),
+
+    # Data container system
+    'RouteDataContainer'     : ('.data_container', 'RouteDataContainer'),
+    'ModuleDataContainer'    : ('.data_container', 'ModuleDataContainer'),
+    'DataContainerManager'   : ('.data_container', 'DataContainerManager'),
+    'ContainerStatus'        : ('.data_container', 'ContainerStatus'),
+    'ContainerData'          : ('.data_container', 'ContainerData'),
+    'container_manager'      : ('.data_container', 'container_manager'),
+    'container_property'     : ('.data_container', 'container_property'),
+    'auto_container'         : ('.data_container', 'auto_container'),
+    'DataReference'          : ('.data_container', 'DataReference'),
+
+    # Builder system for elegant configuration
+    'NavixAppBuilder'        : ('.builders', 'NavixAppBuilder'),
+    'Navix_app'              : ('.builders', 'Navix_app'),
+    'NavigationBuilder'      : ('.builders', 'NavigationBuilder'),
+    'ValidationBuilder'      : ('.builders', 'ValidationBuilder'),
+    'InterceptorBuilder'     : ('.builders', 'InterceptorBuilder'),
+    'ContainerBuilder'       : ('.builders', 'ContainerBuilder'),
+    'interceptors'           : ('.builders', 'interceptors'),
+    'containers'             : ('.builders', 'containers'),
+
+    # RBAC manager
+    'rbac_manager'           : ('.security.rbac', 'rbac_manager'),
+}
+
+# every lazy name plus the builder helpers and direct instance access helpers bound below
+__all__  = tuple(_LAZY) + ('navigation', 'validation', 'get_ui_class', 'create_ui_instance')
+_ALL_SET = frozenset(__all__)
+
+def __getattr__(name):
+    """
+    Resolve a public name on first access and cache it in the module namespace
+    Args:
+        name: The attribute name to resolve.
+    Returns:
+        The resolved object.
+    """
+    # the helpers in __all__ that are not in _LAZY are bound below, so never reach here
+    if name not in _ALL_SET:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    spec = _LAZY[name]
+    module = importlib.import_module(spec[0], __name__)
+    obj    = getattr(module, spec[1])
+    globals()[name] = obj
+    return obj
+
+def __dir__():
+    """
+    List the public names, resolved or not, with the module globals
+    Returns:
+        The sorted attribute names.
+    """
+    return sorted(_ALL_SET.union(globals()))
+
+# The navigation / validation builder helpers share their names with subpackages, and
+# importing a subpackage rebinds the package attribute to it. Import both subpackages
+# first, then bind the helpers over them.
+importlib.import_module('.navigation', __name__)
+importlib.import_module('.validation', __name__)
+from .builders.navigation_builder import navigation
+from .builders.validation_builder import validation
 
 # Convenience functions for direct instance access
 def get_ui_class(route):
     """Get UI class for a route"""
-    return RouteCatalog.get_ui_class(route)
+    return __getattr__('RouteCatalog').get_ui_class(route)
 
 def create_ui_instance(route, **params):
     """Create UI instance directly without navigation"""
-    return RouteCatalog.create_ui_instance(route, **params)
-
-__all__ = [
-    # Core components
-    'RouteCatalog', 
-    'UIVoyager',
-    'RouteSource', 
-    'RouteManager',
-    
-    # Navigation utilities
-    'navigate', 
-    'setup_navigator',
-    
-    # Professional interfaces
-    'IRouteValidator',
-    'INavigationInterceptor', 
-    'IUILifecycleManager',
-    'IRouteRegistry',
-    'IGUIFrameworkAdapter',
-    'IWidgetWrapper',
-    
-    # Validation system
-    'RouteValidator',
-    'SecurityValidator',
-    'route_validator',
-    'security_validator',
-    
-    # Exception system
-    'NavixError',
-    'NavigationError',
-    'RouteError',
-    'RouteNotFoundError',
-    'RouteConflictError',
-    'FrameworkError',
-    'ValidationError',
-    
-    # Direct instance access
-    'get_ui_class',
-    'create_ui_instance',
-
-    # Data container system
-    'RouteDataContainer',
-    'ModuleDataContainer',
-    'DataContainerManager', 
-    'ContainerStatus',
-    'ContainerData',
-    'container_manager',
-    'container_property',
-    'auto_container',
-    'DataReference',
-
-    # Builder system
-    'NavixAppBuilder',
-    'Navix_app',
-    'NavigationBuilder',
-    'ValidationBuilder',
-    'InterceptorBuilder', 
-    'ContainerBuilder',
-    'navigation',
-    'validation',
-    'interceptors',
-    'containers',
-
-    #tool
-    'rbac_manager',
-]
-
-
+    return __getattr__('RouteCatalog').create_ui_instance(route, **params)
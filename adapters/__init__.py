@@ -4,9 +4,35 @@ QXX Adapters - framework Agnostic GUI Toolkit
 This module provides a framework-agnostic interface for GUI development, 
 """
 
-from .gui_adapter import GUIAdapter
-from .widget_wrapper import WidgetWrapper, WidgetProtocol
-from .framework_detectors import FrameworkDetector
+# standard library imports
+import importlib
+
+# public name -> adapter submodule; resolved on first access (PEP 562)
+_LAZY = {
+    'GUIAdapter'       : 'gui_adapter',
+    'WidgetWrapper'    : 'widget_wrapper',
+    'WidgetProtocol'   : 'widget_wrapper',
+    'FrameworkDetector': 'framework_detectors',
+}
+
+def __getattr__(name):
+    """
+    Resolve an adapter name on first access and cache it in the package namespace
+    Args:
+        name: The attribute name to resolve.
+    Returns:
+        The resolved object.
+    """
+    submodule = _LAZY.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{submodule}", __name__)
+    obj    = getattr(module, name)
+    globals()[name] = obj
+    return obj
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 __all__ = [
     'GUIAdapter',
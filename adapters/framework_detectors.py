@@ -1,22 +1,111 @@
 # standard library imports
 import importlib
+import importlib.util
 import logging
-from   typing import Tuple, Any
+import os
+import sys
+from   typing import Tuple, Any, Dict, List, Optional, Set
+
 # qxx libraries
+from ..config import base as config_base
 
 logger = logging.getLogger(__name__)
 
-from ..config import global_config
-
 class FrameworkDetector:
     """
     Detects the available GUI framework
     and provides a way to set it manually.
     """
-    # unified list of supported frameworks
-    frameworks = global_config.Frameworks()
-    if not frameworks:
-        raise ValueError("No GUI frameworks configured in GlobalConfig.")
+    # unified list of supported frameworks, read from GlobalConfig on first use,
+    # plus its (framework_name, module_name, widget_class) rows keyed by name
+    _frameworks_cache:  Optional[Dict[str, Any]] = None
+    _frameworks_tuples: Dict[str, Tuple[str, str, str]] = {}
+
+    # environment variable naming the preferred framework, tried first
+    preference_env = "NAVIX_GUI_FRAMEWORK"
+
+    # detection caches: module names known to be missing, the detected result,
+    # and framework name -> (framework_module, widget_base) once resolved
+    _negative_cache: Set[str] = set()
+    _positive: Optional[Tuple[str, Any, Any]] = None
+    _resolved: Dict[str, Tuple[Any, Any]] = {}
+
+    @classmethod
+    def _get_frameworks(cls) -> Dict[str, Any]:
+        """
+        get the configured GUI frameworks, loading them on first call
+        Returns:
+            Dictionary mapping framework names to their configuration.
+        Raises:
+            ValueError if no frameworks are configured.
+        """
+        if cls._frameworks_cache is None:
+            frameworks = config_base.global_config.Frameworks()
+            if not frameworks:
+                raise ValueError("No GUI frameworks configured in GlobalConfig.")
+            cls._frameworks_tuples = {
+                key: (key, framework["module_name"], framework["widget_class"])
+                for key, framework in frameworks.items()
+            }
+            cls._frameworks_cache = frameworks
+        return cls._frameworks_cache
+
+    @classmethod
+    def _candidates(cls) -> List[Tuple[str, str, str]]:
+        """
+        framework rows in detection order, the preferred one first
+        Returns:
+            List of (framework_name, module_name, widget_class) tuples.
+        """
+        cls._get_frameworks()
+        rows = list(cls._frameworks_tuples.values())
+        preferred = cls._frameworks_tuples.get(os.environ.get(cls.preference_env))
+        if preferred is not None:
+            rows.remove(preferred)
+            rows.insert(0, preferred)
+        return rows
+
+    @staticmethod
+    def _is_available(module_name: str) -> bool:
+        """
+        check whether a module can be imported without executing it
+        The top-level package is probed first: find_spec on a dotted name
+        imports its parent package, which is wasted work when the
+        framework is not installed at all.
+        Args:
+            module_name: dotted module name to look up
+        Returns:
+            True if an import spec for the module exists.
+        """
+        try:
+            top_level = module_name.partition('.')[0]
+            if top_level != module_name and importlib.util.find_spec(top_level) is None:
+                return False
+            return importlib.util.find_spec(module_name) is not None
+        except (ImportError, ValueError):
+            return False
+
+    @classmethod
+    def _resolve(cls, key: str, module_name: str, widget_class: str) -> Tuple[Any, Any]:
+        """
+        import a framework binding and its widget base, once per framework
+        Args:
+            key: framework name
+            module_name: dotted module name of the binding
+            widget_class: name of the base widget class in that module
+        Returns:
+            Tuple of (framework_module, widget_base)
+        Raises:
+            ImportError if the binding cannot be imported.
+        """
+        cached = cls._resolved.get(key)
+        if cached is not None:
+            return cached
+        module = sys.modules.get(module_name)
+        if module is None:
+            module = importlib.import_module(module_name)
+        cached = cls._resolved[key] = (module, getattr(module, widget_class))
+        return cached
 
     @classmethod
     def detect_framework(cls) -> Tuple[str, Any, Any]:
@@ -27,17 +116,24 @@ class FrameworkDetector:
         Returns:
             Tuple of (framework_name, framework_module, widget_base)
         """
-        if cls.frameworks is None:
-            raise RuntimeError("No GUI frameworks configured in GlobalConfig.")
-       
-        for key in cls.frameworks: 
-            framework = cls.frameworks[key]
+        if cls._positive is not None:
+            return cls._positive
+
+        for key, module_name, widget_class in cls._candidates():
+            if module_name in cls._negative_cache:
+                continue
+            if (key not in cls._resolved and module_name not in sys.modules
+                    and not cls._is_available(module_name)):
+                cls._negative_cache.add(module_name)
+                logger.warning("Framework %s not available: %s not found", key, module_name)
+                continue
             try:
-                module = importlib.import_module(framework["module_name"])
-                widget_base = getattr(module, framework["widget_class"])
-                return key, module, widget_base
+                module, widget_base = cls._resolve(key, module_name, widget_class)
+                cls._positive = (key, module, widget_base)
+                return cls._positive
             except ImportError as e:
-                logger.warning(f"Framework {key} not available: {e}")
+                cls._negative_cache.add(module_name)
+                logger.warning("Framework %s not available: %s", key, e)
         raise RuntimeError("No supported GUI framework found")
     
     @classmethod
@@ -49,16 +145,15 @@ class FrameworkDetector:
         Returns:
             Tuple of (framework_module, widget_base)
         """
-        if framework_name not in cls.frameworks: 
+        cls._get_frameworks()
+        row = cls._frameworks_tuples.get(framework_name)
+        if row is None: 
             raise ValueError(f"Framework {framework_name} is not configured in GlobalConfig.")
         
-        framework = cls.frameworks[framework_name]
         try:
-            module = importlib.import_module(framework["module_name"])
-            widget_base = getattr(module, framework["widget_class"])
-            return module, widget_base
+            return cls._resolve(*row)
         except ImportError as e:
-            logger.error(f"Failed to set framework {framework_name}: {e}")
+            logger.error("Failed to set framework %s: %s", framework_name, e)
             raise RuntimeError(f"Failed to set framework {framework_name}")
 
         
\ No newline at end of file
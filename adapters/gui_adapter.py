@@ -1,14 +1,25 @@
 # standard library imports
-from   typing import Any, Type, TYPE_CHECKING
+from   typing import Any, Dict, Optional, Type
 import logging
+import weakref
 
 # qxx libraries
 from .framework_detectors import FrameworkDetector
-if TYPE_CHECKING:
-    from .widget_wrapper import WidgetWrapper
+from .widget_wrapper      import WidgetWrapper, wrap_widget
 
 logger = logging.getLogger(__name__)
 
+# id(native widget) -> live WidgetWrapper; a wrapper keeps its widget alive,
+# so the id cannot be reused while the entry exists
+_WRAPPER_CACHE: "weakref.WeakValueDictionary[int, WidgetWrapper]" = weakref.WeakValueDictionary()
+
+# resolved framework, mirrored from GUIAdapter for the hot navigation path
+_FRAMEWORK_NAME: Optional[str]  = None
+_WIDGET_BASE:    Optional[Type] = None
+
+# concrete type -> isinstance(obj, _WIDGET_BASE) answer, reset when the framework changes
+_IS_INSTANCE_CACHE: Dict[type, bool] = {}
+
 class GUIAdapter:
     """
     this class provides a unified interface for different GUI frameworks.
@@ -38,8 +49,9 @@ class GUIAdapter:
         cls._detected_framework = framework_name
         cls._framework = framework_module  
         cls._widget_base = widget_base
+        cls._publish(framework_name, widget_base)
         
-        logger.info(f"Detected framework: {framework_name}")
+        logger.info("Detected framework: %s", framework_name)
         return framework_name
 
     @classmethod
@@ -56,8 +68,23 @@ class GUIAdapter:
         cls._detected_framework = framework_name
         cls._framework = framework_module
         cls._widget_base = widget_base
+        cls._publish(framework_name, widget_base)
+        _WRAPPER_CACHE.clear()
         
-        logger.info(f"Set framework: {framework_name}")
+        logger.info("Set framework: %s", framework_name)
+
+    @staticmethod
+    def _publish(framework_name: str, widget_base: Type):
+        """
+        mirror the resolved framework into the module-level fast path
+        Args:
+            framework_name: name of the resolved framework
+            widget_base: base widget class of the resolved framework
+        """
+        global _FRAMEWORK_NAME, _WIDGET_BASE
+        _FRAMEWORK_NAME = framework_name
+        _WIDGET_BASE    = widget_base
+        _IS_INSTANCE_CACHE.clear()
 
     @classmethod
     def get_framework_name(cls) -> str:
@@ -66,9 +93,7 @@ class GUIAdapter:
         Returns:
             The name of the currently set GUI framework.
         """
-        if not cls._detected_framework:
-            cls.detect_framework()
-        return cls._detected_framework
+        return _FRAMEWORK_NAME or cls.detect_framework()
     
     @classmethod
     def get_widget_base(cls) -> Type:
@@ -79,9 +104,9 @@ class GUIAdapter:
         Returns:
             The base widget class for the currently set GUI framework.
         """
-        if not cls._widget_base:
+        if _WIDGET_BASE is None:
             cls.detect_framework()
-        return cls._widget_base
+        return _WIDGET_BASE
     
     @classmethod
     def is_widget_instance(cls, obj: Any) -> bool:
@@ -92,17 +117,28 @@ class GUIAdapter:
         Returns:
             True if the object is an instance of the base widget class, False otherwise.
         """
-        widget_base = cls.get_widget_base()
-        return isinstance(obj, widget_base)
+        obj_type = type(obj)
+        cached   = _IS_INSTANCE_CACHE.get(obj_type)
+        if cached is not None:
+            return cached
+        widget_base = _WIDGET_BASE or cls.get_widget_base()
+        result = _IS_INSTANCE_CACHE[obj_type] = isinstance(obj, widget_base)
+        return result
     
     @classmethod
-    def adapt_widget_methods(cls, widget: Any) -> 'WidgetWrapper':
+    def adapt_widget_methods(cls, widget: Any) -> WidgetWrapper:
         """
         Wraps the widget to provide a unified interface across different frameworks.
+        The wrapper is reused while it is alive, so repeated navigation to the
+        same widget does not rebuild it.
         Args:
             widget: The widget instance to wrap.
         Returns:
             A WidgetWrapper instance that adapts the widget methods.
         """
-        from .widget_wrapper import WidgetWrapper
-        return WidgetWrapper(widget, cls.get_framework_name())
\ No newline at end of file
+        wrapper = _WRAPPER_CACHE.get(id(widget))
+        if wrapper is not None and wrapper._widget is widget:
+            return wrapper
+        wrapper = wrap_widget(widget, _FRAMEWORK_NAME or cls.get_framework_name())
+        _WRAPPER_CACHE[id(widget)] = wrapper
+        return wrapper
\ No newline at end of file
@@ -1,5 +1,5 @@
 # standard library imports
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, Dict, Optional, Protocol, Tuple, runtime_checkable
 
 @runtime_checkable
 class WidgetProtocol(Protocol):
@@ -15,116 +15,221 @@ class WidgetProtocol(Protocol):
     def raise_(self) -> None: ...
     def activateWindow(self) -> None: ...
 
+    __slots__ = ()
+
+# adapters turning a native method into the unified WidgetWrapper signature
+def _negated(fn):
+    return lambda: not fn()
+
+def _tk_zoomed(fn):
+    return lambda: fn('zoomed')
+
+def _tk_state(fn):
+    return lambda enabled: fn(state='normal' if enabled else 'disabled')
+
+def _tk_geometry(fn):
+    return lambda width, height: fn(f"{width}x{height}")
+
+# framework name -> widget toolkit family
+_FAMILIES = {
+    'PyQt6'   : 'qt',
+    'PyQt5'   : 'qt',
+    'PySide6' : 'qt',
+    'PySide2' : 'qt',
+    'wxPython': 'wx',
+    'tkinter' : 'tk',
+}
+
+# family -> operation -> (native attribute, adapter)
+_OPS = {
+    'qt': {
+        'show'            : ('show', None),
+        'close'           : ('close', None),
+        'is_hidden'       : ('isHidden', None),
+        'set_parent'      : ('setParent', None),
+        'raise'           : ('raise_', None),
+        'activate'        : ('activateWindow', None),
+        'show_normal'     : ('showNormal', None),
+        'show_minimized'  : ('showMinimized', None),
+        'show_maximized'  : ('showMaximized', None),
+        'hide'            : ('hide', None),
+        'show_full_screen': ('showFullScreen', None),
+        'set_focus'       : ('setFocus', None),
+        'set_enabled'     : ('setEnabled', None),
+        'resize'          : ('resize', None),
+    },
+    'wx': {
+        'show'            : ('Show', None),
+        'close'           : ('Close', None),
+        'is_hidden'       : ('IsShown', _negated),
+        'set_parent'      : ('SetParent', None),
+        'activate'        : ('Raise', None),
+        'show_normal'     : ('Restore', None),
+        'show_minimized'  : ('Iconify', None),
+        'show_maximized'  : ('Maximize', None),
+        'hide'            : ('Hide', None),
+        'show_full_screen': ('ShowFullScreen', None),
+        'set_focus'       : ('SetFocus', None),
+        'set_enabled'     : ('Enable', None),
+        'resize'          : ('SetSize', None),
+    },
+    'tk': {
+        'close'           : ('destroy', None),
+        'is_hidden'       : ('winfo_viewable', _negated),
+        'activate'        : ('lift', None),
+        'show_minimized'  : ('iconify', None),
+        'show_maximized'  : ('state', _tk_zoomed),
+        'hide'            : ('withdraw', None),
+        'set_focus'       : ('focus_set', None),
+        'set_enabled'     : ('config', _tk_state),
+        'resize'          : ('geometry', _tk_geometry),
+    },
+}
+
+# framework-agnostic probe order, used when the family entry does not match the widget
+_GENERIC_OPS = {
+    'show'            : (('show', None), ('Show', None)),
+    'close'           : (('close', None), ('Close', None), ('destroy', None)),
+    'is_hidden'       : (('isHidden', None), ('IsShown', _negated), ('winfo_viewable', _negated)),
+    'set_parent'      : (('setParent', None), ('SetParent', None)),
+    'raise'           : (('raise_', None),),
+    'activate'        : (('activateWindow', None), ('Raise', None), ('lift', None)),
+    'show_normal'     : (('showNormal', None), ('Restore', None)),
+    'show_minimized'  : (('showMinimized', None), ('Iconify', None), ('iconify', None)),
+    'show_maximized'  : (('showMaximized', None), ('Maximize', None), ('state', _tk_zoomed)),
+    'hide'            : (('hide', None), ('Hide', None), ('withdraw', None)),
+    'show_full_screen': (('showFullScreen', None), ('ShowFullScreen', None)),
+    'set_focus'       : (('setFocus', None), ('SetFocus', None), ('focus_set', None)),
+    'set_enabled'     : (('setEnabled', None), ('Enable', None), ('config', _tk_state)),
+    'resize'          : (('resize', None), ('SetSize', None), ('geometry', _tk_geometry)),
+}
+
+def _select_op(target: Any, table: dict, op: str) -> Optional[Tuple[str, Any]]:
+    """
+    pick the native attribute implementing an operation
+    Args:
+        target: The native widget, or its type.
+        table: The family operation table.
+        op: The operation name.
+    Returns:
+        The (native attribute, adapter) pair, or None if unsupported.
+    """
+    candidates = _GENERIC_OPS[op]
+    preferred  = table.get(op)
+    if preferred is not None:
+        candidates = (preferred,) + candidates
+    for attr_name, adapter in candidates:
+        if getattr(target, attr_name, None) is not None:
+            return attr_name, adapter
+    return None
+
+def _resolve_op(widget: Any, table: dict, op: str):
+    """
+    resolve the native callable for an operation once
+    Args:
+        widget: The native widget.
+        table: The family operation table.
+        op: The operation name.
+    Returns:
+        The (adapted) bound callable, or None if the widget does not support it.
+    """
+    selected = _select_op(widget, table, op)
+    if selected is None:
+        return None
+    attr_name, adapter = selected
+    fn = getattr(widget, attr_name)
+    return adapter(fn) if adapter else fn
+
 class WidgetWrapper:
     """
     This class provides a consistent API for common widget operations
     across different GUI frameworks.
+    The native callables are resolved once per wrapper from a per-framework
+    dispatch table instead of probing the widget on every call.
     Waring: This is a simplified version and may not cover all methods
     or properties of the native widget.
+    Note: instances use __slots__; subclasses must declare their own
+    __slots__ to stay dict-free, otherwise they get a __dict__ as usual.
     """
+    __slots__ = (
+        '_widget', '_framework',
+        '_show', '_close', '_is_hidden', '_set_parent', '_raise', '_activate',
+        '_show_normal', '_show_minimized', '_show_maximized', '_hide',
+        '_show_full_screen', '_set_focus', '_set_enabled', '_resize',
+        '__weakref__',
+    )
+
     def __init__(self, widget: Any, framework: str):
         self._widget = widget
-        self._framework = framework 
+        self._framework = framework
+        table = _OPS.get(_FAMILIES.get(framework), {})
+        for op in _GENERIC_OPS:
+            setattr(self, '_' + op, _resolve_op(widget, table, op))
     
     def show(self):
-        if hasattr(self._widget, 'show'):
-            self._widget.show()
-        elif hasattr(self._widget, 'Show'):  # wxPython
-            self._widget.Show()
+        fn = self._show
+        if fn is not None:
+            fn()
     
     def close(self):
-        if hasattr(self._widget, 'close'):
-            self._widget.close()
-        elif hasattr(self._widget, 'Close'):  # wxPython
-            self._widget.Close()
-        elif hasattr(self._widget, 'destroy'):  # tkinter
-            self._widget.destroy()
+        fn = self._close
+        if fn is not None:
+            fn()
     
     def is_hidden(self) -> bool:
-        if hasattr(self._widget, 'isHidden'):
-            return self._widget.isHidden()
-        elif hasattr(self._widget, 'IsShown'):  # wxPython
-            return not self._widget.IsShown()
-        elif hasattr(self._widget, 'winfo_viewable'):  # tkinter
-            return not self._widget.winfo_viewable()
-        return False
+        fn = self._is_hidden
+        return fn() if fn is not None else False
     
     def set_parent(self, parent: Any):
-        if hasattr(self._widget, 'setParent'):
-            self._widget.setParent(parent)
-        elif hasattr(self._widget, 'SetParent'):  # wxPython
-            self._widget.SetParent(parent)
+        fn = self._set_parent
+        if fn is not None:
+            fn(parent)
     
     def bring_to_front(self):
-        if hasattr(self._widget, 'raise_'):
-            self._widget.raise_()
-        if hasattr(self._widget, 'activateWindow'):
-            self._widget.activateWindow()
-        elif hasattr(self._widget, 'Raise'):  # wxPython
-            self._widget.Raise()
-        elif hasattr(self._widget, 'lift'):  # tkinter
-            self._widget.lift()
+        if self._raise is not None:
+            self._raise()
+        if self._activate is not None:
+            self._activate()
     
     def show_normal(self):
-        if hasattr(self._widget, 'showNormal'):
-            self._widget.showNormal()
-        elif hasattr(self._widget, 'Restore'):  # wxPython
-            self._widget.Restore()
+        fn = self._show_normal
+        if fn is not None:
+            fn()
 
     def show_minimized(self):
-        if hasattr(self._widget, 'showMinimized'):
-            self._widget.showMinimized()
-        elif hasattr(self._widget, 'Iconify'):  # wxPython
-            self._widget.Iconify()
-        elif hasattr(self._widget, 'iconify'):  # tkinter
-            self._widget.iconify()
+        fn = self._show_minimized
+        if fn is not None:
+            fn()
     
     def show_maximized(self):
-        if hasattr(self._widget, 'showMaximized'):
-            self._widget.showMaximized()
-        elif hasattr(self._widget, 'Maximize'):  # wxPython
-            self._widget.Maximize()
-        elif hasattr(self._widget, 'state'):  # tkinter
-            self._widget.state('zoomed')
+        fn = self._show_maximized
+        if fn is not None:
+            fn()
     
     def hide(self):
-        if hasattr(self._widget, 'hide'):
-            self._widget.hide()
-        elif hasattr(self._widget, 'Hide'):  # wxPython
-            self._widget.Hide()
-        elif hasattr(self._widget, 'withdraw'):  # tkinter
-            self._widget.withdraw()
+        fn = self._hide
+        if fn is not None:
+            fn()
 
     def show_full_screen(self):
-        if hasattr(self._widget, 'showFullScreen'):
-            self._widget.showFullScreen()
-        elif hasattr(self._widget, 'ShowFullScreen'):  # wxPython
-            self._widget.ShowFullScreen()
+        fn = self._show_full_screen
+        if fn is not None:
+            fn()
 
     def set_focus(self):
-        if hasattr(self._widget, 'setFocus'):
-            self._widget.setFocus()
-        elif hasattr(self._widget, 'SetFocus'):  # wxPython
-            self._widget.SetFocus()
-        elif hasattr(self._widget, 'focus_set'):  # tkinter
-            self._widget.focus_set()
+        fn = self._set_focus
+        if fn is not None:
+            fn()
 
     def set_enabled(self, enabled: bool):
-        if hasattr(self._widget, 'setEnabled'):
-            self._widget.setEnabled(enabled)
-        elif hasattr(self._widget, 'Enable'):  # wxPython
-            self._widget.Enable(enabled)
-        elif hasattr(self._widget, 'config'):  # tkinter
-            state = 'normal' if enabled else 'disabled'
-            self._widget.config(state=state)
+        fn = self._set_enabled
+        if fn is not None:
+            fn(enabled)
 
     def resize(self, width: int, height: int):
-        if hasattr(self._widget, 'resize'):
-            self._widget.resize(width, height)
-        elif hasattr(self._widget, 'SetSize'):  # wxPython
-            self._widget.SetSize(width, height)
-        elif hasattr(self._widget, 'geometry'):  # tkinter
-            self._widget.geometry(f"{width}x{height}")
+        fn = self._resize
+        if fn is not None:
+            fn(width, height)
     
     @property
     def native_widget(self) -> Any:
@@ -147,3 +252,83 @@ class WidgetWrapper:
         """
         return getattr(self._widget, name)
 
+
+# code templates mirroring the adapters above, used by the specialized subclasses
+_CALL_TEMPLATES = {
+    None        : "self._widget.{attr}({args})",
+    _negated    : "not self._widget.{attr}()",
+    _tk_zoomed  : "self._widget.{attr}('zoomed')",
+    _tk_state   : "self._widget.{attr}(state='normal' if enabled else 'disabled')",
+    _tk_geometry: "self._widget.{attr}(f'{{width}}x{{height}}')",
+}
+
+# public method -> (parameters, operations, value returned when unsupported)
+_METHODS = {
+    'show'            : ('', ('show',), None),
+    'close'           : ('', ('close',), None),
+    'is_hidden'       : ('', ('is_hidden',), False),
+    'set_parent'      : ('parent', ('set_parent',), None),
+    'bring_to_front'  : ('', ('raise', 'activate'), None),
+    'show_normal'     : ('', ('show_normal',), None),
+    'show_minimized'  : ('', ('show_minimized',), None),
+    'show_maximized'  : ('', ('show_maximized',), None),
+    'hide'            : ('', ('hide',), None),
+    'show_full_screen': ('', ('show_full_screen',), None),
+    'set_focus'       : ('', ('set_focus',), None),
+    'set_enabled'     : ('enabled', ('set_enabled',), None),
+    'resize'          : ('width, height', ('resize',), None),
+}
+
+# (framework, widget type) -> generated WidgetWrapper subclass
+_SPECIALIZED: Dict[Tuple[str, type], type] = {}
+
+def _specialized_init(self, widget: Any, framework: str):
+    self._widget = widget
+    self._framework = framework
+
+def _make_specialized(framework: str, widget_type: type) -> type:
+    """
+    generate a WidgetWrapper subclass whose methods call the native methods directly
+    Args:
+        framework: The framework name.
+        widget_type: The concrete native widget class.
+    Returns:
+        The generated subclass.
+    """
+    table = _OPS[_FAMILIES[framework]]
+    lines = []
+    for method, (params, ops, default) in _METHODS.items():
+        calls = []
+        for op in ops:
+            selected = _select_op(widget_type, table, op)
+            if selected is not None:
+                attr_name, adapter = selected
+                calls.append(_CALL_TEMPLATES[adapter].format(attr=attr_name, args=params))
+        lines.append(f"def {method}(self{', ' + params if params else ''}):")
+        if method == 'is_hidden':
+            lines.append(f"    return {calls[0] if calls else default}")
+        else:
+            lines.extend(f"    {call}" for call in calls or ['pass'])
+    namespace = {}
+    exec('\n'.join(lines), namespace)
+    namespace.pop('__builtins__', None)
+    namespace['__slots__'] = ()
+    namespace['__init__']  = _specialized_init
+    return type(f"WidgetWrapper_{framework}_{widget_type.__name__}", (WidgetWrapper,), namespace)
+
+def wrap_widget(widget: Any, framework: str) -> WidgetWrapper:
+    """
+    wrap a widget, using a generated subclass specialized for its framework and type
+    Args:
+        widget: The native widget.
+        framework: The framework name.
+    Returns:
+        A WidgetWrapper instance; the generic class is used for unknown frameworks.
+    """
+    if framework not in _FAMILIES:
+        return WidgetWrapper(widget, framework)
+    key = (framework, type(widget))
+    wrapper_class = _SPECIALIZED.get(key)
+    if wrapper_class is None:
+        wrapper_class = _SPECIALIZED[key] = _make_specialized(framework, type(widget))
+    return wrapper_class(widget, framework)
@@ -4,11 +4,41 @@ Navix Builders - Fluent API for Navix Application Configuration
 Provides fluent builder pattern for elegant Navix application setup
 """
 
-from .app_builder         import NavixAppBuilder, Navix_app
-from .navigation_builder  import NavigationBuilder, navigation
-from .validation_builder  import ValidationBuilder, validation
-from .interceptor_builder import InterceptorBuilder, interceptors
-from .container_builder   import ContainerBuilder, containers 
+# standard library imports
+import importlib
+
+# public name -> builder submodule; resolved on first access (PEP 562)
+_LAZY = {
+    'NavixAppBuilder'   : 'app_builder',
+    'Navix_app'         : 'app_builder',
+    'NavigationBuilder' : 'navigation_builder',
+    'navigation'        : 'navigation_builder',
+    'ValidationBuilder' : 'validation_builder',
+    'validation'        : 'validation_builder',
+    'InterceptorBuilder': 'interceptor_builder',
+    'interceptors'      : 'interceptor_builder',
+    'ContainerBuilder'  : 'container_builder',
+    'containers'        : 'container_builder',
+}
+
+def __getattr__(name):
+    """
+    Resolve a builder name on first access and cache it in the package namespace
+    Args:
+        name: The attribute name to resolve.
+    Returns:
+        The resolved object.
+    """
+    submodule = _LAZY.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{submodule}", __name__)
+    obj    = getattr(module, name)
+    globals()[name] = obj
+    return obj
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 __all__ = [
     'NavixAppBuilder',
@@ -3,19 +3,20 @@ Navix Application Builder - Fluent API for complete application setup
 """
 # standard library imports
 import      logging
-from typing import Type, List, Dict, Any, Callable, Optional
+import      sys
+from typing import Type, List, Tuple, Dict, Any, Callable, Optional
 from enum   import Enum
-import      importlib
-import      traceback
 
 # Navix libraries
 from ..navigation         import UIVoyager
+from ..routing            import RouteCatalog, setup_navigator
+from ..data_container     import container_manager
 from ..adapters           import GUIAdapter, FrameworkDetector
-from .navigation_builder  import NavigationBuilder
-from .validation_builder  import ValidationBuilder
-from .interceptor_builder import InterceptorBuilder
-from .container_builder   import ContainerBuilder
-from ..config             import global_config
+from .navigation_builder  import NavigationBuilder, NavigationConfig
+from .validation_builder  import ValidationBuilder, ValidationConfig
+from .interceptor_builder import InterceptorBuilder, InterceptorConfig
+from .container_builder   import ContainerBuilder, ContainerConfig
+from ..config             import base as config_base
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +27,11 @@ class NavixAppBuilder:
     Example:
     please see the module docstring for usage examples.
     """
+    __slots__ = (
+        '_app_name', '_framework', '_core_routes', '_main_route', '_gui_widgets_module',
+        '_navigation_builder', '_validation_builder', '_interceptor_builder', '_container_builder',
+        '_config', '_startup_hooks', '_shutdown_hooks',
+    )
     
     def __init__(self, app_name: str):
         self._app_name = app_name
@@ -34,18 +40,18 @@ class NavixAppBuilder:
         self._main_route:  Optional[Enum] = None
         self._gui_widgets_module = None
         
-        # Builder instances
-        self._navigation_builder  = NavigationBuilder()
-        self._validation_builder  = ValidationBuilder()
-        self._interceptor_builder = InterceptorBuilder()
-        self._container_builder   = ContainerBuilder()
+        # Builder instances, created on first use
+        self._navigation_builder:  Optional[NavigationBuilder]  = None
+        self._validation_builder:  Optional[ValidationBuilder]  = None
+        self._interceptor_builder: Optional[InterceptorBuilder] = None
+        self._container_builder:   Optional[ContainerBuilder]   = None
         
         # Configuration
         self._config: Dict[str, Any] = {}
         self._startup_hooks: List[Callable] = []
         self._shutdown_hooks: List[Callable] = []
         
-        logger.debug(f"Navix App Builder initialized for: {app_name}")
+        logger.debug("Navix App Builder initialized for: %s", app_name)
     
     def framework(self, framework_name: str) -> 'NavixAppBuilder':
         """
@@ -60,9 +66,9 @@ class NavixAppBuilder:
         try:
             FrameworkDetector.set_framework(framework_name) 
             self._framework = framework_name
-            logger.debug(f"Framework validated and set: {framework_name}")
+            logger.debug("Framework validated and set: %s", framework_name)
         except (ValueError, ImportError) as e:
-            logger.error(f"Framework validation failed: {e}")
+            logger.error("Framework validation failed: %s", e)
             raise ValueError(f"Unsupported or unavailable framework: {framework_name}. {e}")
         return self
     
@@ -75,9 +81,9 @@ class NavixAppBuilder:
         try:
             framework_name, _, _ = FrameworkDetector.detect_framework() 
             self._framework = framework_name
-            logger.debug(f"Auto-detected framework: {framework_name}")
+            logger.debug("Auto-detected framework: %s", framework_name)
         except RuntimeError as e:
-            logger.error(f"Framework auto-detection failed: {e}")
+            logger.error("Framework auto-detection failed: %s", e)
             raise
         
         return self
@@ -130,43 +136,54 @@ class NavixAppBuilder:
     def import_ui_modules(self, *module_paths: str) -> 'NavixAppBuilder':
         """
         Import UI modules for route registration
+        Modules can list their UI classes in __navix_routes__ to skip the class scan.
         Args:
             *module_paths: List of module paths to import
         Returns:
             self for fluent chaining
         """
+        from importlib import import_module
         for module_path in module_paths:
             try:
-                module = __import__(module_path, fromlist=[''])
+                # already-imported modules (e.g. __name__ of the caller) skip the import machinery
+                module = sys.modules.get(module_path) or import_module(module_path)
               
                 # debug logging
-                logger.info(f"Success imported UI module: {module_path}")
+                logger.info("Success imported UI module: %s", module_path)
                 
                 # check for classes in the module
                 route_classes  = self._try_import_ui_classes(module, module_path)
                 # debug logging
                 if route_classes:
-                    logger.debug(f"Found UI classes in {module_path}: {route_classes}")
+                    logger.debug("Found UI classes in %s: %s", module_path, route_classes)
                 else:
-                    logger.warning(f"No UI classes found in {module_path}")
+                    logger.warning("No UI classes found in %s", module_path)
 
             except ImportError as e:
                 raise ImportError(f"Critical module import failed: {module_path} - {e}")
             except Exception as e:
-                logger.error(f"Unexpected error importing {module_path}: {e}")
+                logger.error("Unexpected error importing %s: %s", module_path, e)
                 raise
         return self
     
     #  
     def _try_import_ui_classes(self, module: Any, module_path: str)-> List[str]:
-        import inspect
-        route_classes = []
-        for name, obj in inspect.getmembers(module):
-            if (inspect.isclass(obj) and 
-                hasattr(obj, '__module__') and  
-                obj.__module__ == module_path):
-                route_classes.append(name)
-        return route_classes
+        """
+        List the UI classes of an imported module
+        A module may declare them in a module-level __navix_routes__ tuple
+        (classes or class names); otherwise the classes defined in (not
+        re-exported by) the module are listed.
+        Args:
+            module: The imported module object
+            module_path: Dotted path the module was imported from
+        Returns:
+            Names of the declared classes, or of the classes whose __module__ is module_path
+        """
+        declared = getattr(module, '__navix_routes__', None)
+        if declared is not None:
+            return [getattr(cls, '__name__', cls) for cls in declared]
+        return [name for name, obj in vars(module).items()
+                if isinstance(obj, type) and getattr(obj, '__module__', None) == module_path]
                
     # Fluent sub-builders
     def validation(self) -> ValidationBuilder:
@@ -175,6 +192,8 @@ class NavixAppBuilder:
         Returns:
             ValidationBuilder instance for fluent configuration
         """
+        if self._validation_builder is None:
+            self._validation_builder = ValidationBuilder()
         self._validation_builder._parent = self
         return self._validation_builder
     
@@ -184,6 +203,8 @@ class NavixAppBuilder:
         Returns:
             InterceptorBuilder instance for fluent configuration
         """
+        if self._interceptor_builder is None:
+            self._interceptor_builder = InterceptorBuilder()
         self._interceptor_builder._parent = self
         return self._interceptor_builder
     
@@ -193,6 +214,8 @@ class NavixAppBuilder:
         Returns:
             ContainerBuilder instance for fluent configuration
         """
+        if self._container_builder is None:
+            self._container_builder = ContainerBuilder()
         self._container_builder._parent = self
         return self._container_builder
     
@@ -202,6 +225,8 @@ class NavixAppBuilder:
         Returns:
             NavigationBuilder instance for fluent configuration
         """
+        if self._navigation_builder is None:
+            self._navigation_builder = NavigationBuilder()
         self._navigation_builder._parent = self
         return self._navigation_builder
     
@@ -212,7 +237,7 @@ class NavixAppBuilder:
         Build the final Navix application
         """
         # debug logging
-        logger.debug(f"Building Navix app: {self._app_name}")
+        logger.debug("Building Navix app: %s", self._app_name)
         
         # Build application
         app = NavixApplication(
@@ -221,18 +246,18 @@ class NavixAppBuilder:
             core_routes=self._core_routes,
             main_route=self._main_route,
             config=self._config,
-            startup_hooks=self._startup_hooks,
-            shutdown_hooks=self._shutdown_hooks
+            startup_hooks=tuple(self._startup_hooks),
+            shutdown_hooks=tuple(self._shutdown_hooks)
         )
         
-        # Apply configurations
-        self._validation_builder._apply_to_app(app)
-        self._interceptor_builder._apply_to_app(app)
-        self._container_builder._apply_to_app(app)
-        self._navigation_builder._apply_to_app(app)
+        # Apply configurations (untouched sub-builders leave the app's empty defaults)
+        for builder in (self._validation_builder, self._interceptor_builder,
+                        self._container_builder, self._navigation_builder):
+            if builder is not None and builder._state:
+                builder._apply_to_app(app)
         
         # debug logging
-        logger.debug(f"Navix application '{self._app_name}' built successfully")
+        logger.debug("Navix application '%s' built successfully", self._app_name)
         return app
 
 
@@ -241,10 +266,22 @@ class NavixApplication:
     """
     Built Navix Application - Ready to run
     """
+    __slots__ = (
+        'name', 'framework', 'core_routes', 'main_route', 'config',
+        'startup_hooks', 'shutdown_hooks', 'voyager', 'main_window', 'frameworks',
+        '_gui_app', '_gui_widgets_module',
+        # resolved once in _import_gui_widgets, reused by run()
+        '_framework_name', '_framework_info', '_application_class', '_mainloop_method_name',
+        '_mainloop_method',
+        # filled in by the builders' _apply_to_app
+        '_validation_config', '_interceptor_config', '_container_config', '_navigation_config',
+    )
+    # GlobalConfig framework table, shared by all applications
+    _frameworks_cache: Optional[Dict[str, Any]] = None
     
     def __init__(self, name: str, framework: Optional[str], core_routes: Optional[Type[Enum]],
                  main_route: Optional[Enum], config: Dict[str, Any],
-                 startup_hooks: List[Callable], shutdown_hooks: List[Callable]):
+                 startup_hooks: Tuple[Callable, ...], shutdown_hooks: Tuple[Callable, ...]):
         self.name           = name
         self.framework      = framework
         self.core_routes    = core_routes
@@ -256,20 +293,32 @@ class NavixApplication:
         self.voyager: Optional[UIVoyager] = None
         self.main_window = None
         self._gui_app    = None
+        self._mainloop_method: Optional[Callable] = None
         
-        # Configuration storage for builders
-        self._validation_config  = {}
-        self._interceptor_config = {}
-        self._container_config   = {}
-        self._navigation_config  = {}
+        # Configuration storage for builders (None when a builder was not used)
+        self._validation_config:  Optional[ValidationConfig]  = None
+        self._interceptor_config: Optional[InterceptorConfig] = None
+        self._container_config:   Optional[ContainerConfig]   = None
+        self._navigation_config:  Optional[NavigationConfig]  = None
         
-        self.frameworks = global_config.Frameworks()
+        if NavixApplication._frameworks_cache is None:
+            NavixApplication._frameworks_cache = config_base.global_config.Frameworks()
+        self.frameworks = NavixApplication._frameworks_cache
         if not self.frameworks:
             raise ValueError("No GUI frameworks configured in GlobalConfig.")
         
         # Initialize framework
         self._setup_framework()
     
+    @classmethod
+    def refresh_frameworks(cls) -> None:
+        """
+        Drop the cached framework table
+        Call after changing the GlobalConfig frameworks at runtime; the next
+        application picks up the new table.
+        """
+        cls._frameworks_cache = None
+    
     def _setup_framework(self):
         """
         Setup GUI framework using GUIAdapter
@@ -279,9 +328,11 @@ class NavixApplication:
         else:
             GUIAdapter.detect_framework()
        
-        # debug logging
-        #detected_framework = GUIAdapter.get_framework_name()
-        #logger.debug(f"Navix Application using framework: {detected_framework}")
+        # resolve the framework entry once; later steps use the cached attributes
+        self._framework_name = GUIAdapter.get_framework_name()
+        self._framework_info = self.frameworks.get(self._framework_name)
+        if self._framework_info is None:
+            raise ImportError(f"Framework {self._framework_name} is not configured in GlobalConfig.")
      
         # Import GUI widgets using GUIAdapter's detection
         self._import_gui_widgets()
@@ -292,11 +343,10 @@ class NavixApplication:
         This method uses the detected framework to import the correct widgets.
         If the framework is not supported, it raises an ImportError.
         """
-        framework_name = GUIAdapter.get_framework_name()
-        if framework_name not in self.frameworks:
-            raise ImportError(f"Framework {framework_name} is not configured in GlobalConfig.")
+        framework_name, framework_info = self._framework_name, self._framework_info
+        # deferred: only needed when an application is actually built
+        import importlib
         try:
-            framework_info           = self.frameworks[framework_name]
             module_name, widget_base = framework_info['module_name'], framework_info['widget_class']
             self._gui_widgets_module = importlib.import_module(module_name)
             # Optionally, check widget_base exists
@@ -304,8 +354,10 @@ class NavixApplication:
                 raise ImportError(f"Widget base class {widget_base} not found in {module_name}")
             # Do NOT overwrite self._gui_widgets with the class
             # self._gui_widgets = getattr(self._gui_widgets, widget_base)
+            self._application_class     = getattr(self._gui_widgets_module, framework_info['application_class'], None)
+            self._mainloop_method_name  = config_base.global_config.Framework_main_loop(framework_name)
         except ImportError as e:
-            logger.error(f"Failed to import widgets for framework {framework_name}: {e}")
+            logger.error("Failed to import widgets for framework %s: %s", framework_name, e)
             raise ImportError(f"Failed to import widgets for framework {framework_name}: {e}")
 
     # Application lifecycle methods
@@ -317,26 +369,23 @@ class NavixApplication:
         """
         try:
             # Execute startup hooks 
-            for hook in self.startup_hooks:  hook(self)
+            startup_hooks = self.startup_hooks
+            for hook in startup_hooks:  hook(self)
             
-            # Create GUI application  by framework type
-            framework_name = GUIAdapter.get_framework_name()
-            if framework_name not in self.frameworks:
-                raise ImportError(f"Framework {framework_name} is not configured in GlobalConfig.")
-          
-            application_class = self.frameworks[framework_name]['application_class']
-
-            # Use the module to get the application class
-            instance_class = getattr(self._gui_widgets_module, application_class, None)
+            # Create GUI application from the class resolved in _import_gui_widgets
+            instance_class = self._application_class
             if not instance_class:
+                application_class = self._framework_info['application_class']
                 raise ImportError(f"Application class {application_class} not found in {self._gui_widgets_module.__name__}")
             self._gui_app = instance_class([])  # Create application instance
+            # bind the main loop once, alongside the application instance
+            if self._mainloop_method_name:
+                self._mainloop_method = getattr(self._gui_app, self._mainloop_method_name, None)
            
             # Setup navigation - from core routes
             if self.core_routes:
-                from ..routing import setup_navigator
                 setup_navigator(self.core_routes)
-                logger.debug(f"Setup navigator with {len(self.core_routes)} core routes")
+                logger.debug("Setup navigator with %d core routes", len(self.core_routes))
             
             # Create voyager with configuration
             voyager_instance = UIVoyager(
@@ -364,16 +413,18 @@ class NavixApplication:
                 return self._run_main_loop()
                 
         except Exception as e:
-            logger.error(f"Application startup failed: {e}")
+            logger.error("Application startup failed: %s", e)
+            import traceback
             traceback.print_exc()
             return 1
         
         finally:
-            for hook in self.shutdown_hooks:
+            shutdown_hooks = self.shutdown_hooks
+            for hook in shutdown_hooks:
                 try:
                     hook(self)
                 except Exception as e:
-                    logger.warning(f"Shutdown hook failed: {e}")
+                    logger.warning("Shutdown hook failed: %s", e)
 
     def _apply_builder_configurations(self):
         """
@@ -381,75 +432,86 @@ class NavixApplication:
         This method applies validation, interceptor, container, and navigation configurations
         to the UIVoyager instance.
         """
-        # debug logging
-        logger.debug("Applying builder configurations...")
+        # logging levels are checked once, so disabled messages cost nothing in the loops
+        debug_on = logger.isEnabledFor(logging.DEBUG)
+        info_on  = logger.isEnabledFor(logging.INFO)
+        debug    = logger.debug
+        voyager  = self.voyager
+        if debug_on:
+            debug("Applying builder configurations...")
         
         # Apply validation configuration
-        if hasattr(self, '_validation_config') and self._validation_config:
-            validation_config = self._validation_config
-            
+        validation_config = self._validation_config
+        if validation_config is not None:
             # Add route patterns
-            patterns = validation_config.get('patterns', [])
+            patterns    = validation_config.patterns
+            add_pattern = voyager.add_route_pattern
             for pattern in patterns:
-                self.voyager.add_route_pattern(pattern)
-                logger.debug(f"Added route pattern: {pattern}")
+                add_pattern(pattern)
+                if debug_on:
+                    debug("Added route pattern: %s", pattern)
             
             # Add parameter rules
-            parameter_rules = validation_config.get('parameter_rules', {})
+            parameter_rules = validation_config.parameter_rules
+            add_rule        = voyager.add_parameter_rule
             for param_name, validator_func in parameter_rules.items():
-                self.voyager.add_parameter_rule(param_name, validator_func)
-                logger.debug(f"Added parameter rule: {param_name}")
+                add_rule(param_name, validator_func)
+                if debug_on:
+                    debug("Added parameter rule: %s", param_name)
             
             # Set security checker
-            security_checker = validation_config.get('security_checker')
-            security_param_name = validation_config.get('security_param_name', "user_id")
+            security_checker = validation_config.security_checker
             if security_checker:
-                self.voyager.set_security_checker(security_checker, param_names=security_param_name)
-                logger.debug("Applied security checker")
+                voyager.set_security_checker(security_checker, param_names=validation_config.security_param_name)
+                if debug_on:
+                    debug("Applied security checker")
             
-            logger.info(f"Applied validation config: {len(patterns)} patterns, {len(parameter_rules)} parameter rules")
+            if info_on:
+                logger.info("Applied validation config: %d patterns, %d parameter rules", len(patterns), len(parameter_rules))
         
         # Apply interceptor configuration
-        if hasattr(self, '_interceptor_config') and self._interceptor_config:
-            interceptor_config = self._interceptor_config
-            
+        interceptor_config = self._interceptor_config
+        if interceptor_config is not None:
             # Register interceptors
-            from ..routing import RouteCatalog
-            interceptors = interceptor_config.get('interceptors', [])
-            for interceptor_name, interceptor in interceptors:
-                RouteCatalog.add_interceptor(interceptor)
-                logger.debug(f"Registered interceptor: {interceptor_name}")
+            interceptors    = interceptor_config.instances
+            add_interceptor = RouteCatalog.add_interceptor
+            for interceptor_name, interceptor in zip(interceptor_config.names, interceptors):
+                add_interceptor(interceptor)
+                if debug_on:
+                    debug("Registered interceptor: %s", interceptor_name)
             
-            logger.info(f"Applied interceptor config: {len(interceptors)} interceptors")
+            if info_on:
+                logger.info("Applied interceptor config: %d interceptors", len(interceptors))
         
         # Apply container configuration
-        if hasattr(self, '_container_config') and self._container_config:
-            container_config = self._container_config
-            
+        container_config = self._container_config
+        if container_config is not None:
             # Set global data
-            global_data = container_config.get('global_data', {})
+            global_data = container_config.global_data
             if global_data:
-                from ..data_container import container_manager
-                # Set global data in core module
-                for key, value in global_data.items():
-                    container_manager.core.main_window.set_data(key, value)
-                    logger.debug(f"Set global data: {key}")
+                # Set global data in core module, as one bulk update
+                container_manager.core.main_window.update(global_data)
+                if debug_on:
+                    debug("Set global data: %s", ', '.join(global_data))
             
-            logger.info(f"Applied container config: {len(global_data)} global data items")
+            if info_on:
+                logger.info("Applied container config: %d global data items", len(global_data))
         
         # Apply navigation configuration
-        if hasattr(self, '_navigation_config') and self._navigation_config:
-            navigation_config = self._navigation_config
-            
+        navigation_config = self._navigation_config
+        if navigation_config is not None:
             # Set max history
-            max_history = navigation_config.get('max_history', 50)
-            if hasattr(self.voyager, '_max_history'):
-                self.voyager._max_history = max_history
-                logger.debug(f"Set max history: {max_history}")
+            max_history = navigation_config.max_history
+            if hasattr(voyager, '_max_history'):
+                voyager._max_history = max_history
+                if debug_on:
+                    debug("Set max history: %s", max_history)
             
-            logger.info("Applied navigation configuration")
+            if info_on:
+                logger.info("Applied navigation configuration")
         
-        logger.info("All builder configurations applied successfully")
+        if info_on:
+            logger.info("All builder configurations applied successfully")
 
     def _run_main_loop(self) -> int:
         """
@@ -457,33 +519,15 @@ class NavixApplication:
         Returns:
             Exit code (0 for success, 1 for failure)
         """
-        framework_name  = GUIAdapter.get_framework_name()
-        mainloop_method = global_config.Framework_main_loop(framework_name)
-        if not mainloop_method:
-            logger.error(f"Main loop method not found for framework: {framework_name}")
-            return 1
-        instance_method = getattr(self._gui_app, mainloop_method, None)
-      
-        if not instance_method:
-            logger.error(f"Main loop method {mainloop_method} not found in GUI application")
+        instance_method = self._mainloop_method
+        if instance_method is None:
+            if not self._mainloop_method_name:
+                logger.error("Main loop method not found for framework: %s", self._framework_name)
+            else:
+                logger.error("Main loop method %s not found in GUI application", self._mainloop_method_name)
             return 1
     
         return instance_method()
-
-        if framework.startswith(('PyQt', 'PySide')):
-            return self._gui_app.exec()
-      
-        elif framework == 'wxPython':
-            self._gui_app.MainLoop()
-            return 0
-      
-        elif framework == 'tkinter':
-            self._gui_app.mainloop()
-            return 0
-     
-        else:
-            logger.error(f"Don't know how to run main loop for framework: {framework}")
-            return 1
     
     def _print_startup_info(self):
         """
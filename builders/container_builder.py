@@ -3,13 +3,25 @@ Navix Container Builder - Fluent API for data container configuration
 """
 
 import logging
-from typing import Dict, Any, List, TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Callable, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .app_builder import NavixAppBuilder
 
 logger = logging.getLogger(__name__)
 
+@dataclass(slots=True)
+class ContainerConfig:
+    """
+    Container configuration handed to the built application
+    """
+    preload_modules: List[str]         = field(default_factory=list)
+    global_data: Dict[str, Any]        = field(default_factory=dict)
+    auto_cleanup: bool                 = False
+    status_monitoring: bool            = False
+    container_hooks: List[Callable]    = field(default_factory=list)
+
 class ContainerBuilder:
     """
     Fluent builder for data container configuration
@@ -21,14 +33,12 @@ class ContainerBuilder:
             .auto_cleanup(True)
             .status_monitoring(True)
     """
+    __slots__ = ('_parent', '_state')
     
     def __init__(self):
         self._parent: 'NavixAppBuilder' = None
-        self._preload_modules = []
-        self._global_data = {}
-        self._auto_cleanup = False
-        self._status_monitoring = False
-        self._container_hooks = []
+        # only the options actually configured; handed to the app as-is
+        self._state: Dict[str, Any] = {}
     
     def preload_modules(self, modules: List[str]) -> 'ContainerBuilder':
         """
@@ -38,7 +48,7 @@ class ContainerBuilder:
         Returns:
             self
         """
-        self._preload_modules.extend(modules)
+        self._state.setdefault('preload_modules', []).extend(modules)
         return self
     
     def global_data(self, data: Dict[str, Any]) -> 'ContainerBuilder':
@@ -49,7 +59,7 @@ class ContainerBuilder:
         Returns:
             self
         """
-        self._global_data.update(data)
+        self._state.setdefault('global_data', {}).update(data)
         return self
     
     def auto_cleanup(self, enabled: bool = True) -> 'ContainerBuilder':
@@ -60,7 +70,7 @@ class ContainerBuilder:
         Returns:
             self
         """
-        self._auto_cleanup = enabled
+        self._state['auto_cleanup'] = enabled
         return self
     
     def status_monitoring(self, enabled: bool = True) -> 'ContainerBuilder':
@@ -71,7 +81,7 @@ class ContainerBuilder:
         Returns:
             self
         """
-        self._status_monitoring = enabled
+        self._state['status_monitoring'] = enabled
         return self
     
     def container_hook(self, hook: callable) -> 'ContainerBuilder':
@@ -82,7 +92,7 @@ class ContainerBuilder:
         Returns:
             self
         """
-        self._container_hooks.append(hook)
+        self._state.setdefault('container_hooks', []).append(hook)
         return self
     
     # Convenience methods for common global data
@@ -140,15 +150,9 @@ class ContainerBuilder:
         Args:
             app: The Navix application instance to apply configuration to
         """
-        app._container_config = {
-            'preload_modules': self._preload_modules,
-            'global_data': self._global_data,
-            'auto_cleanup': self._auto_cleanup,
-            'status_monitoring': self._status_monitoring,
-            'container_hooks': self._container_hooks
-        }
+        config = app._container_config = ContainerConfig(**self._state)
         
-        logger.debug(f"Applied container config: {len(self._preload_modules)} preload modules, {len(self._global_data)} global data items")
+        logger.debug("Applied container config: %d preload modules, %d global data items", len(config.preload_modules), len(config.global_data))
 
 # Convenience function
 def containers() -> ContainerBuilder:
@@ -3,7 +3,9 @@ Navix Interceptor Builder - Fluent API for interceptor configuration
 """
 # standard library imports
 import logging
-from typing import Callable, Any, TYPE_CHECKING
+import sys
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Any, Tuple, TYPE_CHECKING
 
 # qxx libraries
 if TYPE_CHECKING:
@@ -11,6 +13,72 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# (Logging, Security, Performance, RateLimit) interceptor classes, imported on first use
+_interceptor_classes = None
+
+def _get_interceptor_classes() -> Tuple[type, type, type, type]:
+    """
+    import the built-in interceptor classes once
+    Returns:
+        The (LoggingInterceptor, SecurityInterceptor, PerformanceInterceptor, RateLimitInterceptor) tuple.
+    """
+    global _interceptor_classes
+    if _interceptor_classes is None:
+        from ..navigation.interceptors import (
+            LoggingInterceptor, SecurityInterceptor, PerformanceInterceptor, RateLimitInterceptor
+        )
+        _interceptor_classes = (LoggingInterceptor, SecurityInterceptor, PerformanceInterceptor, RateLimitInterceptor)
+    return _interceptor_classes
+
+@dataclass(slots=True)
+class SecurityConfig:
+    """
+    Settings recorded by the security sub-builder
+    """
+    blocked_routes: Tuple[str, ...]      = ()
+    user_permissions: Dict[str, set]     = field(default_factory=dict)
+
+@dataclass(slots=True)
+class PerformanceConfig:
+    """
+    Settings recorded by performance()
+    """
+    track_memory: bool                   = False
+
+@dataclass(slots=True)
+class RateLimitConfig:
+    """
+    Settings recorded by rate_limit()
+    """
+    max_requests: int                    = 10
+    window_seconds: int                  = 60
+
+@dataclass(slots=True)
+class InterceptorConfig:
+    """
+    Interceptor configuration handed to the built application
+    The sequences are in registration order; RouteCatalog.add_interceptor orders them.
+    """
+    names: Tuple[str, ...]                = ()
+    instances: Tuple[Any, ...]            = ()
+    security_config: SecurityConfig       = field(default_factory=SecurityConfig)
+    performance_config: PerformanceConfig = field(default_factory=PerformanceConfig)
+    rate_limit_config: RateLimitConfig    = field(default_factory=RateLimitConfig)
+
+class _LambdaInterceptor:
+    """ Lambda-based interceptor implementation"""
+    __slots__ = ('_func', '_priority')
+    
+    def __init__(self, func: Callable[[str, dict], bool], priority: int):
+        self._func = func
+        self._priority = priority
+    
+    def intercept(self, route: str, params: dict) -> bool:
+        return self._func(route, params)
+    
+    def get_priority(self) -> int:
+        return self._priority
+
 class InterceptorBuilder:
     """
     Fluent builder for interceptor configuration
@@ -25,13 +93,13 @@ class InterceptorBuilder:
             .rate_limit(max_requests=10, window_seconds=60)
             .custom(my_interceptor)
     """
+    __slots__ = ('_parent', '_state')
     
     def __init__(self):
         self._parent: 'NavixAppBuilder' = None
-        self._interceptors       = []
-        self._security_config    = {}
-        self._performance_config = {}
-        self._rate_limit_config  = {}
+        # only the options actually configured; interceptors are kept as parallel
+        # 'names' / 'instances' sequences (see _add)
+        self._state: Dict[str, Any]     = {}
     
     def logging(self, priority: int = 100, logger_name: str = None) -> 'InterceptorBuilder':
         """
@@ -42,9 +110,8 @@ class InterceptorBuilder:
         Returns:
             self
         """
-        from ..navigation.interceptors import LoggingInterceptor
-        interceptor = LoggingInterceptor(priority=priority)
-        self._interceptors.append(('logging', interceptor))
+        interceptor = _get_interceptor_classes()[0](priority=priority)
+        self._add('logging', interceptor)
         return self
     
     def security(self, priority: int = 200) -> 'SecurityInterceptorBuilder':
@@ -55,9 +122,8 @@ class InterceptorBuilder:
         Returns:
             SecurityInterceptorBuilder: Sub-builder for security interceptor configuration
         """
-        from ..navigation.interceptors import SecurityInterceptor
-        interceptor = SecurityInterceptor(priority=priority)
-        self._interceptors.append(('security', interceptor))
+        interceptor = _get_interceptor_classes()[1](priority=priority)
+        self._add('security', interceptor)
         return SecurityInterceptorBuilder(self, interceptor)
     
     def performance(self, priority: int = 90, track_memory: bool = False) -> 'InterceptorBuilder':
@@ -69,10 +135,9 @@ class InterceptorBuilder:
         Returns:
             self
         """
-        from ..navigation.interceptors import PerformanceInterceptor
-        interceptor = PerformanceInterceptor(priority=priority)
-        self._interceptors.append(('performance', interceptor))
-        self._performance_config.update({'track_memory': track_memory})
+        interceptor = _get_interceptor_classes()[2](priority=priority)
+        self._add('performance', interceptor)
+        self._settings('performance_config', PerformanceConfig).track_memory = track_memory
         return self
     
     def rate_limit(self, max_requests: int = 10, window_seconds: int = 60, priority: int = 150) -> 'InterceptorBuilder':
@@ -85,9 +150,10 @@ class InterceptorBuilder:
         Returns:
             self
         """
-        from ..navigation.interceptors import RateLimitInterceptor
-        interceptor = RateLimitInterceptor(max_requests, window_seconds, priority)
-        self._interceptors.append(('rate_limit', interceptor))
+        interceptor = _get_interceptor_classes()[3](max_requests, window_seconds, priority)
+        self._add('rate_limit', interceptor)
+        settings = self._settings('rate_limit_config', RateLimitConfig)
+        settings.max_requests, settings.window_seconds = max_requests, window_seconds
         return self
     
     def custom(self, interceptor: Any, name: str = None) -> 'InterceptorBuilder':
@@ -99,8 +165,8 @@ class InterceptorBuilder:
         Returns:
             self
         """
-        interceptor_name = name or f"custom_{len(self._interceptors)}"
-        self._interceptors.append((interceptor_name, interceptor))
+        interceptor_name = sys.intern(name or f"custom_{len(self._state.get('names', ()))}")
+        self._add(interceptor_name, interceptor)
         return self
     
     def lambda_interceptor(self, func: Callable[[str, dict], bool], priority: int = 100, name: str = None) -> 'InterceptorBuilder':
@@ -111,24 +177,38 @@ class InterceptorBuilder:
             priority: Priority of the interceptor
             name: Optional name for the interceptor
         """
-
-        class LambdaInterceptor:
-            """ Lambda-based interceptor implementation"""
-            def __init__(self, func, priority):
-                self._func = func
-                self._priority = priority
-            
-            def intercept(self, route: str, params: dict) -> bool:
-                return self._func(route, params)
-            
-            def get_priority(self) -> int:
-                return self._priority
-        
-        interceptor = LambdaInterceptor(func, priority)
-        interceptor_name = name or f"lambda_{len(self._interceptors)}"
-        self._interceptors.append((interceptor_name, interceptor))
+        interceptor = _LambdaInterceptor(func, priority)
+        interceptor_name = sys.intern(name or f"lambda_{len(self._state.get('names', ()))}")
+        self._add(interceptor_name, interceptor)
         return self
     
+    def _add(self, name: str, interceptor: Any):
+        """
+        Record an interceptor in the parallel name / instance sequences
+        Args:
+            name: Interceptor name
+            interceptor: Interceptor instance or callable
+        """
+        state = self._state
+        if 'names' not in state:
+            state['names'], state['instances'] = [], []
+        state['names'].append(name)
+        state['instances'].append(interceptor)
+    
+    def _settings(self, key: str, record_type: type) -> Any:
+        """
+        Get the settings record stored under key, creating it on first use
+        Args:
+            key: The state key ('security_config', 'performance_config', 'rate_limit_config')
+            record_type: The dataclass to create when missing
+        Returns:
+            The settings record.
+        """
+        record = self._state.get(key)
+        if record is None:
+            record = self._state[key] = record_type()
+        return record
+    
     # Return to parent builder
     def end(self) -> 'NavixAppBuilder':
         """
@@ -139,22 +219,28 @@ class InterceptorBuilder:
         return self._parent
     
     def _apply_to_app(self, app):
-        """Apply interceptor configuration to the application"""
-        app._interceptor_config = {
-            'interceptors': self._interceptors,
-            'security_config': self._security_config,
-            'performance_config': self._performance_config,
-            'rate_limit_config': self._rate_limit_config
-        }
+        """
+        Apply interceptor configuration to the application
+        The parallel interceptor sequences are frozen into tuples in registration order;
+        interceptors added to this builder afterwards only take effect if it is applied again.
+        Args:
+            app: The Navix application instance to apply configuration to
+        """
+        state = dict(self._state)
+        if 'names' in state:
+            for key in ('names', 'instances'):
+                state[key] = tuple(state[key])
+        config = app._interceptor_config = InterceptorConfig(**state)
         
-        logger.debug(f"Applied interceptor config: {len(self._interceptors)} interceptors")
+        logger.debug("Applied interceptor config: %d interceptors", len(config.names))
 
 
         #Apply security configuration if any
-        #if self._security_config:
-        #    security_interceptor = next((i for i in self._interceptors if i[0] == 'security'), None)
+        #if 'security_config' in self._state:
+        #    names = self._state['names']
+        #    security_interceptor = self._state['instances'][names.index('security')] if 'security' in names else None
         #    if security_interceptor:
-        #        security_interceptor[1].configure(self._security_config)
+        #        security_interceptor.configure(self._state['security_config'])
 
 class SecurityInterceptorBuilder:
     """
@@ -165,6 +251,7 @@ class SecurityInterceptorBuilder:
             .block_routes('system.dangerous_operation')
             .user_permissions('admin', {'access_all'})
     """
+    __slots__ = ('_parent', '_security_interceptor')
     
     def __init__(self, parent: InterceptorBuilder, security_interceptor):
         self._parent = parent
@@ -180,6 +267,8 @@ class SecurityInterceptorBuilder:
         """
         for route in routes:
             self._security_interceptor.block_route(route)
+        settings = self._parent._settings('security_config', SecurityConfig)
+        settings.blocked_routes += routes
         return self
     
     def user_permissions(self, user_id: str, permissions: set) -> 'SecurityInterceptorBuilder':
@@ -192,6 +281,7 @@ class SecurityInterceptorBuilder:
             self
         """
         self._security_interceptor.set_user_permissions(user_id, permissions)
+        self._parent._settings('security_config', SecurityConfig).user_permissions[user_id] = permissions
         return self
     
     def end(self) -> InterceptorBuilder:
@@ -3,7 +3,8 @@ Navix Navigation Builder - Fluent API for navigation configuration
 """
 # standard library imports
 import logging
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Callable, TYPE_CHECKING
 
 # qxx libraries
 if TYPE_CHECKING:
@@ -11,6 +12,16 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+@dataclass(slots=True)
+class NavigationConfig:
+    """
+    Navigation configuration handed to the built application
+    """
+    max_history: int                    = 50
+    auto_discovery_packages: List[str]  = field(default_factory=list)
+    default_parent_mode: str            = 'window'
+    navigation_hooks: List[Callable]    = field(default_factory=list)
+
 class NavigationBuilder:
     """
     Fluent builder for navigation configuration
@@ -21,13 +32,12 @@ class NavigationBuilder:
             .auto_discovery(['myapp.ui_parts'])
             .default_parent_mode('dialog')
     """
+    __slots__ = ('_parent', '_state')
     
     def __init__(self):
         self._parent: 'NavixAppBuilder' = None
-        self._max_history             = 50
-        self._auto_discovery_packages = []
-        self._default_parent_mode     = 'window'
-        self._navigation_hooks        = []
+        # only the options actually configured (max_history defaults to 50, parent mode to 'window')
+        self._state: Dict[str, Any]     = {}
     
     def max_history(self, count: int) -> 'NavigationBuilder':
         """
@@ -37,7 +47,7 @@ class NavigationBuilder:
         Returns:
             self
         """
-        self._max_history = count
+        self._state['max_history'] = count
         return self
     
     def auto_discovery(self, packages: list) -> 'NavigationBuilder':
@@ -48,7 +58,7 @@ class NavigationBuilder:
         Returns:
             self
         """
-        self._auto_discovery_packages.extend(packages)
+        self._state.setdefault('auto_discovery_packages', []).extend(packages)
         return self
     
     def default_parent_mode(self, mode: str) -> 'NavigationBuilder':
@@ -59,7 +69,7 @@ class NavigationBuilder:
         Returns:
             self
         """
-        self._default_parent_mode = mode
+        self._state['default_parent_mode'] = mode
         return self
     
     def navigation_hook(self, hook: callable) -> 'NavigationBuilder':
@@ -70,7 +80,7 @@ class NavigationBuilder:
         Returns:
             self
         """
-        self._navigation_hooks.append(hook)
+        self._state.setdefault('navigation_hooks', []).append(hook)
         return self
     
     # Return to parent builder
@@ -88,14 +98,9 @@ class NavigationBuilder:
         Args:
             app: The Navix application instance to apply configuration to
         """
-        app._navigation_config = {
-            'max_history': self._max_history,
-            'auto_discovery_packages': self._auto_discovery_packages,
-            'default_parent_mode': self._default_parent_mode,
-            'navigation_hooks': self._navigation_hooks
-        }
+        config = app._navigation_config = NavigationConfig(**self._state)
         
-        logger.debug(f"Applied navigation config: max_history={self._max_history}")
+        logger.debug("Applied navigation config: max_history=%s", config.max_history)
 
 # Convenience function
 def navigation() -> NavigationBuilder:
@@ -3,7 +3,10 @@ Navix Validation Builder - Fluent API for validation configuration
 """
 # standard library imports
 import logging
-from typing import Callable, Any, TYPE_CHECKING
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Any, List, Optional, Pattern, Tuple, Union, TYPE_CHECKING
 
 # qxx libraries
 if TYPE_CHECKING:
@@ -11,6 +14,22 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+def _asset_id_valid(value: Any) -> bool:
+    """asset IDs are non-negative ints or digit-only strings"""
+    return value.__class__ is int and value >= 0 or isinstance(value, str) and value.isdigit()
+
+@dataclass(slots=True)
+class ValidationConfig:
+    """
+    Validation configuration handed to the built application
+    """
+    patterns: List[Pattern]                           = field(default_factory=list)
+    parameter_rules: Dict[str, Callable[[Any], bool]] = field(default_factory=dict)
+    security_checker: Optional[Callable]              = None
+    security_param_name: str                          = "user_id"
+    enable_validation: bool                           = True
+    enable_security: bool                             = True
+
 class ValidationBuilder:
     """
     Fluent builder for validation configuration
@@ -23,25 +42,24 @@ class ValidationBuilder:
             .security_checker(my_security_function)
             .enable_security(True)
     """
+    __slots__ = ('_parent', '_state')
     
     def __init__(self):
         self._parent: 'NavixAppBuilder' = None
-        self._route_patterns     = []
-        self._parameter_rules    = {}
-        self._security_checker   = None
-        self._enable_validation  = True
-        self._enable_security    = True
-        self._security_param_name = "user_id"
+        # only the options actually configured; both enable flags default to True
+        self._state: Dict[str, Any]     = {}
     
-    def patterns(self, *patterns: str) -> 'ValidationBuilder':
+    def patterns(self, *patterns: Union[str, Pattern]) -> 'ValidationBuilder':
         """
         Add route naming patterns
+        The patterns are compiled right away, so an invalid regex fails here
+        instead of at application start; the compiled patterns are handed on.
         Args:
             patterns: Regular expression patterns to match route names
         Returns:
             self
         """
-        self._route_patterns.extend(patterns)
+        self._state.setdefault('patterns', []).extend(re.compile(pattern) for pattern in patterns)
         return self
     
     def parameters(self, param_name: str, validator: Callable[[Any], bool]) -> 'ValidationBuilder':
@@ -53,7 +71,7 @@ class ValidationBuilder:
         Returns:
             self
         """
-        self._parameter_rules[param_name] = validator
+        self._state.setdefault('parameter_rules', {})[sys.intern(param_name)] = validator
         return self
     
     def security_checker(self, checker: Callable[[str, dict], bool], param_name: str = "user_id") -> 'ValidationBuilder':
@@ -65,8 +83,8 @@ class ValidationBuilder:
         Returns:
             self
         """
-        self._security_checker = checker
-        self._security_param_name = param_name
+        self._state['security_checker']    = checker
+        self._state['security_param_name'] = param_name
         return self
     
     def enable_validation(self, enabled: bool = True) -> 'ValidationBuilder':
@@ -77,7 +95,7 @@ class ValidationBuilder:
         Returns:
             self
         """
-        self._enable_validation = enabled
+        self._state['enable_validation'] = enabled
         return self
     
     def enable_security(self, enabled: bool = True) -> 'ValidationBuilder':
@@ -88,7 +106,41 @@ class ValidationBuilder:
         Returns:
             self
         """
-        self._enable_security = enabled
+        self._state['enable_security'] = enabled
+        return self
+    
+    def configure(self, *, patterns: Tuple[str, ...] = (), parameters: Optional[Dict[str, Callable[[Any], bool]]] = None,
+                  security_checker: Optional[Callable] = None, security_param_name: Optional[str] = None,
+                  enable_validation: Optional[bool] = None, enable_security: Optional[bool] = None) -> 'ValidationBuilder':
+        """
+        Set several validation options in one call
+        Equivalent to chaining patterns() / parameters() / security_checker() /
+        enable_validation() / enable_security(); options left at None are not touched.
+        Args:
+            patterns: Regular expression patterns to match route names
+            parameters: Mapping of parameter name to validator function
+            security_checker: Function(route, params) -> bool
+            security_param_name: The parameter name used for user identity
+            enable_validation: Whether to enable validation
+            enable_security: Whether to enable security validation
+        Returns:
+            self
+        """
+        state = self._state
+        if patterns:
+            self.patterns(*patterns)
+        if parameters:
+            rules = state.setdefault('parameter_rules', {})
+            for param_name, validator in parameters.items():
+                rules[sys.intern(param_name)] = validator
+        if security_checker is not None:
+            state['security_checker'] = security_checker
+        if security_param_name is not None:
+            state['security_param_name'] = security_param_name
+        if enable_validation is not None:
+            state['enable_validation'] = enable_validation
+        if enable_security is not None:
+            state['enable_security'] = enable_security
         return self
     
     # Standard parameter validators (convenience methods)
@@ -117,7 +169,7 @@ class ValidationBuilder:
         Returns:
             ValidationBuilder instance with asset ID validation rule applied.
         """
-        return self.parameters('asset_id', lambda x: isinstance(x, (int, str)) and str(x).isdigit())
+        return self.parameters('asset_id', _asset_id_valid)
     
     # Return to parent builder
     def end(self) -> 'NavixAppBuilder':
@@ -135,21 +187,17 @@ class ValidationBuilder:
             app: The Navix application instance to apply configuration to
         """ 
 
-        # Apply validation settings to the app
-        app.config.update({
-            'enable_validation': self._enable_validation,
-            'enable_security': self._enable_security
-        })
+        state = self._state
+
+        # Apply the explicitly set validation switches to the app
+        for key in ('enable_validation', 'enable_security'):
+            if key in state:
+                app.config[key] = state[key]
         
         # Store validation config for later application
-        app._validation_config = {
-            'patterns': self._route_patterns,
-            'parameter_rules': self._parameter_rules,
-            'security_checker': self._security_checker,
-            'security_param_name': self._security_param_name
-        }
+        config = app._validation_config = ValidationConfig(**state)
         
-        logger.debug(f"Applied validation config: {len(self._route_patterns)} patterns, {len(self._parameter_rules)} parameter rules")
+        logger.debug("Applied validation config: %d patterns, %d parameter rules", len(config.patterns), len(config.parameter_rules))
 
 # Convenience function
 def validation() -> ValidationBuilder:
@@ -4,7 +4,19 @@ Navix Configuration - Global Configuration Management
 Provides global configuration management for Navix applications
 """
 
-from .base import global_config
+from . import base as _base
+
+def __getattr__(name):
+    """
+    Forward global_config to the lazily created instance in .base
+    Args:
+        name: The attribute name to resolve.
+    Returns:
+        The shared GlobalConfig instance.
+    """
+    if name == 'global_config':
+        return _base.global_config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     'global_config'
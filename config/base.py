@@ -1,20 +1,55 @@
 # standard library imports
+import functools
 import json
+import sys
 from pathlib import Path
-from typing import Any, Dict
+from types   import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
 
 # qxx libraries
 from ..interfaces import IJsonSerializable
 
+# shared empty mapping for missing config sections
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+def _freeze(value: Any) -> Any:
+    """
+    make parsed JSON read-only so it can be shared without copying
+    Args:
+        value: A parsed JSON value.
+    Returns:
+        Dicts as MappingProxyType and lists as tuples, recursively.
+    """
+    if isinstance(value, (dict, MappingProxyType)):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+def _thaw(value: Any) -> Any:
+    """
+    turn frozen config data back into plain JSON-serializable containers
+    Args:
+        value: A value produced by _freeze.
+    Returns:
+        A mutable dict / list copy.
+    """
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
 # Helper function to load global configuration from config.json
-def _get_global_config()-> Dict[str, Any]:
-    """Get global configuration data from config.json"""
-    from pathlib import Path
-    import json
+@functools.cache
+def _get_global_config()-> Mapping[str, Any]:
+    """Get global configuration data from config.json (parsed once per process, read-only)"""
     _config_file = Path(__file__).parent.parent / "config.json"
-    if not _config_file.exists():
-        raise FileNotFoundError(f"Configuration file {_config_file} not found.")
-    return json.loads(_config_file.read_text(encoding='utf-8'))
+    try:
+        with _config_file.open('rb') as fp:
+            return _freeze(json.load(fp))
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file {_config_file} not found.") from None
 
 
 class GlobalConfig(IJsonSerializable):
@@ -25,64 +60,90 @@ class GlobalConfig(IJsonSerializable):
     """
     
     def __init__(self):
-        self._data = _get_global_config()
+        self._load(_get_global_config())
         if not self._data:
             raise ValueError("Configuration data is empty or not loaded properly.")
     
-    def DefaultConfig(self) -> Dict[str, Any]:
-        """Get default configuration settings."""
-        return self._data.get("DefaultConfig", {})
+    def _load(self, data: Mapping[str, Any]):
+        """Store configuration data, flatten the per-framework entries and extract the defaults."""
+        self._data = data
+        # (framework_name, field) -> value, for the Framework_* getters
+        self._fw_flat: Dict[Tuple[str, str], Any] = {
+            (sys.intern(name), sys.intern(field)): value
+            for name, framework in data.get("GuiFrameworks", _EMPTY).items()
+            for field, value in framework.items()
+        }
+        default_config  = data.get("DefaultConfig", _EMPTY)
+        self._app_name  = default_config.get("app_name", "Navix Application")
+        self._version   = default_config.get("version", "1.0.0")
+        self._data_dir  = default_config.get("data_directory", "./data")
+    
+    def DefaultConfig(self) -> Mapping[str, Any]:
+        """Get default configuration settings (read-only)."""
+        return self._data.get("DefaultConfig", _EMPTY)
     
     def AppName(self) -> str:
         """Get the application name."""
-        return self._data.get("DefaultConfig", {}).get("app_name", "Navix Application")
+        return self._app_name
     
     def Version(self) -> str:
         """Get the application version."""
-        return self._data.get("DefaultConfig", {}).get("version", "1.0.0")
+        return self._version
 
     def DataDirectory(self) -> str:
         """Get the data directory path."""
-        return self._data.get("DefaultConfig", {}).get("data_directory", "./data")
+        return self._data_dir
     
-    def Frameworks(self) -> Dict[str, Any]:
-        """Get all configured GUI frameworks."""
-        return self._data.get("GuiFrameworks", {})
+    def Frameworks(self) -> Mapping[str, Any]:
+        """Get all configured GUI frameworks (read-only)."""
+        return self._data.get("GuiFrameworks", _EMPTY)
 
     def Framework_module(self, framework_name: str) -> Any:
         """Get the module name for a specific GUI framework."""
-        return self._data.get("GuiFrameworks", {}).get(framework_name, {}).get("module_name")
+        return self._fw_flat.get((framework_name, "module_name"))
     
     def Framework_widget_class(self, framework_name: str) -> Any:
         """Get the widget class for a specific GUI framework."""
-        return self._data.get("GuiFrameworks", {}).get(framework_name, {}).get("widget_class")
+        return self._fw_flat.get((framework_name, "widget_class"))
     
     def Framework_application_class(self, framework_name: str) -> Any:
         """Get the application class for a specific GUI framework."""
-        return self._data.get("GuiFrameworks", {}).get(framework_name, {}).get("application_class")
+        return self._fw_flat.get((framework_name, "application_class"))
     
     def Framework_main_window_class(self, framework_name: str) -> Any:
         """Get the main window class for a specific GUI framework."""
-        return self._data.get("GuiFrameworks", {}).get(framework_name, {}).get("main_window_class")
+        return self._fw_flat.get((framework_name, "main_window_class"))
     
     def Framework_main_loop(self, framework_name: str) -> Any:
         """Get the main loop method for a specific GUI framework."""
-        return self._data.get("GuiFrameworks", {}).get(framework_name, {}).get("main_loop")
+        return self._fw_flat.get((framework_name, "main_loop"))
     
     def Framework_version(self, framework_name: str) -> str:
         """Get the version of a specific GUI framework."""
-        return self._data.get("GuiFrameworks", {}).get(framework_name, {}).get("version", "unknown")
+        return self._fw_flat.get((framework_name, "version"), "unknown")
 
     def to_json(self) -> Dict[str, Any]:
-        """Convert configuration data to JSON format."""
-        return self._data
+        """Convert configuration data to JSON format (a mutable copy)."""
+        return _thaw(self._data)
     
     @classmethod
     def from_json(cls, data: Dict[str, Any]) -> 'GlobalConfig':
         """Create an instance from JSON data."""
-        instance = cls()
-        instance._data = data
+        instance = cls.__new__(cls)  # skip __init__: no need to read config.json
+        instance._load(_freeze(data))
         return instance
 
 
-global_config = GlobalConfig()
+def __getattr__(name):
+    """
+    Create the global configuration on first access (PEP 562)
+    config.json is only read once something actually asks for global_config.
+    Args:
+        name: The attribute name to resolve.
+    Returns:
+        The shared GlobalConfig instance.
+    """
+    if name == 'global_config':
+        instance = globals()['global_config'] = GlobalConfig()
+        return instance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,15 +3,32 @@ Navix Data Container Core - Smart data management for UI components
 """
 # standard library imports
 import logging
-from   typing import Any, Dict, Optional, List,Union
+from   typing import Any, Dict, Optional, List, Set, Tuple, Union
 from   enum import Enum
-from   dataclasses import dataclass, field
 import weakref
 import time
 import json
 
 logger = logging.getLogger(__name__)
 
+# id(enum member) -> (member, value) for registered routes; the member is kept to verify the id
+_ENUM_VALUE_CACHE: Dict[int, Tuple[Enum, str]] = {}
+
+def _route_key_of(route: Union[str, Enum]) -> str:
+    """
+    convert a route enum member or key to the route key
+    Args:
+        route: Route key or Enum member
+    Returns:
+        The route key string.
+    """
+    if type(route) is str:
+        return route
+    entry = _ENUM_VALUE_CACHE.get(id(route))
+    if entry is not None and entry[0] is route:
+        return entry[1]
+    return route.value if hasattr(route, 'value') else route
+
 class ContainerStatus(Enum):
     """
     Container lifecycle status
@@ -26,16 +43,28 @@ class ContainerStatus(Enum):
     ACTIVE   = "active"       
     ORPHANED = "orphaned"     
 
-@dataclass
 class ContainerData:
     """
     Base container data with metadata
+    Route containers create these lazily, the first time get_metadata asks for a key.
+    A plain class with __slots__ rather than a dataclass: one instance exists
+    per key per route, so dropping the per-instance __dict__ saves memory and
+    speeds up the attribute stores in update_value.
     """
-    value: Any = None
-    created_at: float = field(default_factory=time.time)
-    updated_at: float = field(default_factory=time.time)
-    access_count: int = 0
-    ui_instance_ref: Optional[weakref.ReferenceType] = None
+    __slots__ = ('value', 'created_at', 'updated_at', 'access_count', 'ui_instance_ref')
+    
+    def __init__(self, value: Any = None):
+        self.value: Any = value
+        now = time.time()
+        self.created_at: float = now
+        self.updated_at: float = now
+        self.access_count: int = 0
+        self.ui_instance_ref: Optional[weakref.ReferenceType] = None
+    
+    def __repr__(self) -> str:
+        return (f"ContainerData(value={self.value!r}, created_at={self.created_at!r}, "
+                f"updated_at={self.updated_at!r}, access_count={self.access_count!r}, "
+                f"ui_instance_ref={self.ui_instance_ref!r})")
     
     def update_value(self, new_value: Any):
         """
@@ -51,11 +80,19 @@ class ContainerData:
 class RouteDataContainer:
     """
     Individual route data container with dynamic attribute support
+    Internal state lives in __slots__, so it is found directly and never
+    reaches the dynamic __getattr__ / __setattr__ data access.
+    Values are stored as-is; their ContainerData metadata is only created when
+    get_metadata is called for a key, and kept current from then on.
     """
+    __slots__ = ('_route_key', '_values', '_meta', '_ui_instance_ref', '_status', '_orphan_queue')
     
-    def __init__(self, route_key: str):
+    def __init__(self, route_key: str, orphan_queue: Optional[Set['RouteDataContainer']] = None):
         self._route_key = route_key
-        self._data: Dict[str, ContainerData] = {}
+        # set of the owning DataContainerManager that collects this container once orphaned
+        self._orphan_queue = orphan_queue
+        self._values: Dict[str, Any] = {}
+        self._meta: Dict[str, ContainerData] = {}
         self._ui_instance_ref: Optional[weakref.ReferenceType] = None
         self._status = ContainerStatus.EMPTY
     
@@ -63,20 +100,34 @@ class RouteDataContainer:
     def status(self) -> ContainerStatus:
         """
         Get current container status
+        The status is kept up to date by the methods changing data or the UI
+        instance, and by a weakref callback when the UI instance is collected.
         Returns:
             ContainerStatus: Current status of the container
         """
-        has_ui   = self._ui_instance_ref and self._ui_instance_ref() is not None
-        has_data = bool(self._data)
-        
-        if not has_data and not has_ui:
-            return ContainerStatus.EMPTY
-        elif has_data and not has_ui:
-            return ContainerStatus.ORPHANED if self._status == ContainerStatus.ACTIVE else ContainerStatus.PREPARED
-        elif has_ui and has_data:
-            return ContainerStatus.ACTIVE
-        else:
-            return ContainerStatus.EMPTY
+        return self._status
+    
+    def _on_ui_collected(self, ref: weakref.ReferenceType):
+        """
+        Weakref callback: the UI instance of an active container was destroyed
+        Args:
+            ref: The dead reference; ignored unless it is still the current one
+        """
+        if ref is self._ui_instance_ref and self._status is ContainerStatus.ACTIVE:
+            if self._values:
+                self._status = ContainerStatus.ORPHANED
+                if self._orphan_queue is not None:
+                    self._orphan_queue.add(self)
+            else:
+                self._status = ContainerStatus.EMPTY
+    
+    def _data_added(self):
+        """
+        Leave the EMPTY status after data was stored
+        """
+        if self._status is ContainerStatus.EMPTY:
+            ui_ref = self._ui_instance_ref
+            self._status = ContainerStatus.ACTIVE if ui_ref is not None and ui_ref() is not None else ContainerStatus.PREPARED
     
     def set_ui_instance(self, instance: Any):
         """
@@ -87,13 +138,13 @@ class RouteDataContainer:
         If instance is not None, it updates the reference and sets status to ACTIVE if data exists
         """
         if instance is not None:
-            self._ui_instance_ref = weakref.ref(instance)
-            if self._data:
-                self._status = ContainerStatus.ACTIVE
+            self._ui_instance_ref = weakref.ref(instance, self._on_ui_collected)
+            self._status = ContainerStatus.ACTIVE if self._values else ContainerStatus.EMPTY
         else:
+            # an explicitly removed UI leaves its data prepared for the next instance;
+            # ORPHANED is reserved for UI instances that were destroyed while active
             self._ui_instance_ref = None
-            if self._data:
-                self._status = ContainerStatus.ORPHANED
+            self._status = ContainerStatus.PREPARED if self._values else ContainerStatus.EMPTY
     
     def set_data(self, key: str, value: Any):
         """
@@ -101,17 +152,22 @@ class RouteDataContainer:
         Args:
             key: Data key to set
             value: Value to associate with the key
-        If the key does not exist, it creates a new ContainerData instance.
-        It updates the value and associates it with the current UI instance reference.    
-        """
-        if key not in self._data:
-            self._data[key] = ContainerData()
-        
-        self._data[key].update_value(value)
-        self._data[key].ui_instance_ref = self._ui_instance_ref
-        
-        if self._status == ContainerStatus.EMPTY:
-            self._status = ContainerStatus.PREPARED
+        If metadata was already requested for the key, it is updated too and associated
+        with the current UI instance reference; without a UI instance the metadata
+        keeps the reference it already had.
+        """
+        self._values[key] = value
+        if self._meta:
+            entry = self._meta.get(key)
+            if entry is not None:
+                entry.value         = value
+                entry.updated_at    = time.time()
+                entry.access_count += 1
+                ui_ref = self._ui_instance_ref
+                if ui_ref is not None:
+                    entry.ui_instance_ref = ui_ref
+        if self._status is ContainerStatus.EMPTY:
+            self._data_added()
     
     def get_data(self, key: str, default: Any = None) -> Any:
         """
@@ -122,25 +178,31 @@ class RouteDataContainer:
         Returns:
             The value associated with the key, or default if not found.
         """
-        if key in self._data:
-            self._data[key].access_count += 1
-            return self._data[key].value
-        return default
+        return self._values.get(key, default)
     
-    def clear_data(self, key: Optional[str] = None):
+    def clear_data(self, key: Optional[Union[str, List[str], Tuple[str, ...]]] = None):
         """
         Clear specific data or all data
         Args:
-            key: Data key to clear, if None clears all data
+            key: Data key (or list / tuple of keys) to clear, if None clears all data
         If key is None, it clears all data and updates status to EMPTY.
-        If key exists, it removes the key from the data dictionary.
+        If key exists, it removes the key from the data dictionary; missing keys are ignored.
         """
+        values = self._values
         if key is None:
-            self._data.clear()
-            if not (self._ui_instance_ref and self._ui_instance_ref()):
-                self._status = ContainerStatus.EMPTY
-        elif key in self._data:
-            del self._data[key]
+            values.clear()
+            self._meta.clear()
+        elif key.__class__ is list or key.__class__ is tuple:
+            meta = self._meta
+            for k in key:
+                if k in values:
+                    del values[k]
+                    meta.pop(k, None)
+        elif key in values:
+            del values[key]
+            self._meta.pop(key, None)
+        if not values:
+            self._status = ContainerStatus.EMPTY
     
     def list_keys(self) -> list:
         """
@@ -148,17 +210,23 @@ class RouteDataContainer:
         Returns:
             List of keys in the data container.
         """
-        return list(self._data.keys())
+        return list(self._values)
     
     def get_metadata(self, key: str) -> Optional[ContainerData]:
         """
         Get complete metadata for a key
+        The metadata is created on the first call for a key, so its timestamps
+        start then and its access count only covers the updates made since.
         Args:
             key: Data key to retrieve metadata for
         Returns:
             ContainerData: Metadata object containing value, timestamps, access count, and UI instance reference.
         """
-        return self._data.get(key)
+        entry = self._meta.get(key)
+        if entry is None and key in self._values:
+            entry = self._meta[key] = ContainerData(self._values[key])
+            entry.ui_instance_ref   = self._ui_instance_ref
+        return entry
     
     
     def get(self, key: str, default: Any = None) -> Any:
@@ -186,15 +254,30 @@ class RouteDataContainer:
         Update multiple data values
         Args:
             data: Dictionary of key-value pairs to update
-        """
-        for key, value in data.items():
-            self.set_data(key, value)
-    
-    def clear(self, key: Optional[str] = None):
+        Same result as calling set_data for each pair, but inlined with a single
+        timestamp for the whole batch of metadata updates.
+        """
+        self._values.update(data)
+        meta = self._meta
+        if meta:
+            ui_ref = self._ui_instance_ref
+            now    = time.time()
+            for key, value in data.items():
+                entry = meta.get(key)
+                if entry is not None:
+                    entry.value         = value
+                    entry.updated_at    = now
+                    entry.access_count += 1
+                    if ui_ref is not None:
+                        entry.ui_instance_ref = ui_ref
+        if self._values and self._status is ContainerStatus.EMPTY:
+            self._data_added()
+    
+    def clear(self, key: Optional[Union[str, List[str], Tuple[str, ...]]] = None):
         """
         Clear specific data or all data
         Args:
-            key: Data key to clear, if None clears all data
+            key: Data key (or list / tuple of keys) to clear, if None clears all data
         """
         self.clear_data(key)
     
@@ -208,19 +291,23 @@ class RouteDataContainer:
         Returns:
             List of tuples containing key and value pairs from the data container.
         """
-        return [(key, data.value) for key, data in self._data.items()]
- 
+        return list(self._values.items())
+    
     def __getattr__(self, name: str) -> Any:
         """
         Dynamic attribute access for IDE completion
+        Private names are never data keys; failing fast for them keeps unset
+        slots (and copy / pickle probes) from turning into get_data calls.
         """
+        if name.startswith('_'):
+            raise AttributeError(name)
         return self.get_data(name)
     
     def __setattr__(self, name: str, value: Any):
         """
         Dynamic attribute setting
         """
-        if name.startswith('_') or name in ['status']:
+        if name.startswith('_'):
             super().__setattr__(name, value)
         else:
             self.set_data(name, value)
@@ -235,7 +322,7 @@ class RouteDataContainer:
     
     def __contains__(self, key: str) -> bool:
         """Check if key exists"""
-        return key in self._data
+        return key in self._values
 
 
 
@@ -247,10 +334,13 @@ class ModuleDataContainer:
     This container holds route data containers for a specific module.
     It allows dynamic access to route containers based on module name.      
     """
+    __slots__ = ('_module_name', '_routes', '_route_names', '_orphan_queue')
     
-    def __init__(self, module_name: str):
+    def __init__(self, module_name: str, orphan_queue: Optional[Set[RouteDataContainer]] = None):
         self._module_name = module_name
+        self._orphan_queue = orphan_queue  # handed to the route containers created here
         self._routes: Dict[str, RouteDataContainer] = {}
+        self._route_names: Dict[str, str] = {}  # short name -> full route key
     
     def get_route_container(self, route_key: str) -> RouteDataContainer:
         """
@@ -262,7 +352,7 @@ class ModuleDataContainer:
         If the route key does not exist, it creates a new RouteDataContainer instance.
         """
         if route_key not in self._routes:
-            self._routes[route_key] = RouteDataContainer(route_key)
+            self._routes[route_key] = RouteDataContainer(route_key, self._orphan_queue)
         return self._routes[route_key]
     
     def list_routes(self) -> list:
@@ -283,12 +373,28 @@ class ModuleDataContainer:
             self._routes[route_key].clear_data()
     
 
+    def get(self, name: str) -> RouteDataContainer:
+        """
+        Get / create the route container for a short route name
+        Args:
+            name: Route name within this module (e.g. 'main_window' for 'core.main_window')
+        Returns:
+            RouteDataContainer: The route data container for '<module>.<name>'.
+        """
+        full_route = self._route_names.get(name)
+        if full_route is None:
+            full_route = self._route_names[name] = f"{self._module_name}.{name}"
+        return self.get_route_container(full_route)
+
     def __getattr__(self, name: str) -> RouteDataContainer:
         """
         Dynamic route access
+        Private names are never routes, so probes such as copy / pickle / hasattr
+        fail instead of creating a container.
         """
-        full_route = f"{self._module_name}.{name}"
-        return self.get_route_container(full_route)
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return self.get(name)
 
 
 
@@ -304,6 +410,10 @@ class DataContainerManager:
         self._modules: Dict[str, ModuleDataContainer] = {}
         self._route_registry: Dict[str, str] = {}  # route -> module mapping
         self._route_containers: Dict[str, RouteDataContainer] = {}  # direct route access
+        # id(enum member) -> (member, container); the member is kept to verify the id
+        self._enum_containers: Dict[int, Tuple[Enum, RouteDataContainer]] = {}
+        # containers whose UI instance was collected, drained by cleanup_orphaned
+        self._orphaned: Set[RouteDataContainer] = set()
         
         # Create standard module containers
         self._create_standard_modules()
@@ -311,12 +421,11 @@ class DataContainerManager:
     def _create_standard_modules(self):
         """
         Create standard module containers
-        pass this fubction for example
+        They back the core / asset / data / report properties, so those always
+        return the same instance.
         """
-        pass
-        #standard_modules = ['core', 'asset', 'data', 'report']
-        #for module in standard_modules:
-        #    self._modules[module] = ModuleDataContainer(module)
+        for module in ('core', 'asset', 'data', 'report'):
+            self._modules[module] = ModuleDataContainer(module, self._orphaned)
          
     def list_all_modules(self) -> List[str]:
         """
@@ -349,17 +458,14 @@ class DataContainerManager:
         """
         all_data = {}
         for module_name, module_container in self._modules.items():
-            all_data[module_name] = {}
-            for route_key in module_container.list_routes():
-                container = module_container.get_route_container(route_key)
-                all_data[module_name][route_key] = container.items()
+            all_data[module_name] = module_data = {}
+            for route_key, container in module_container._routes.items():
+                module_data[route_key] = container.items()
         # Add direct route containers not in modules
         for route_key, container in self._route_containers.items():
-            module_name = route_key.split('.')[0]
-            if module_name not in all_data:
-                all_data[module_name] = {}
-            if route_key not in all_data[module_name]:
-                all_data[module_name][route_key] = container.items()
+            module_data = all_data.setdefault(route_key.partition('.')[0], {})
+            if route_key not in module_data:
+                module_data[route_key] = container.items()
         return all_data
     
     def register_route(self, route: Union[str, Enum], module_name: Optional[str] = None):
@@ -369,43 +475,69 @@ class DataContainerManager:
             route: Route key or Enum to register
             module_name: Optional module name to associate with the route
         """
-        route_key = route.value if isinstance(route, Enum) else route
+        route_key = _route_key_of(route)
+        if isinstance(route, Enum):
+            _ENUM_VALUE_CACHE[id(route)] = (route, route_key)
         
         if module_name is None:
             # Auto-detect module from route key
-            module_name = route_key.split('.')[0]
+            module_name = route_key.partition('.')[0]
         
         self._route_registry[route_key] = module_name
         
         # Ensure module container exists
         if module_name not in self._modules:
-            self._modules[module_name] = ModuleDataContainer(module_name)
+            self._modules[module_name] = ModuleDataContainer(module_name, self._orphaned)
         
         # Create direct route container for enum access
         if route_key not in self._route_containers:
-            self._route_containers[route_key] = RouteDataContainer(route_key)
+            self._route_containers[route_key] = RouteDataContainer(route_key, self._orphaned)
     
    
     def get_container(self, route: Union[str, Enum]) -> RouteDataContainer:
-        """Get route data container"""
-        route_key = route.value if isinstance(route, Enum) else route
-
-        # Direct route container access
-        if route_key in self._route_containers:
-            return self._route_containers[route_key]
+        """
+        Get route data container
+        _route_containers doubles as the flat route key -> container cache; enum
+        members are additionally cached by identity so repeated lookups skip .value.
+        Args:
+            route: Route key or Enum member
+        Returns:
+            RouteDataContainer: The container for the route, created on first access.
+        """
+        if type(route) is str:
+            container = self._route_containers.get(route)
+            if container is not None:
+                return container
+            return self._resolve_container(route)
 
-        # Fallback to module-based access
-        module_name = self._route_registry.get(route_key, None)
+        entry = self._enum_containers.get(id(route))
+        if entry is not None and entry[0] is route:
+            return entry[1]
+        route_key = _route_key_of(route)
+        container = self._route_containers.get(route_key)
+        if container is None:
+            container = self._resolve_container(route_key)
+        self._enum_containers[id(route)] = (route, container)
+        return container
+    
+    def _resolve_container(self, route_key: str) -> RouteDataContainer:
+        """
+        Resolve a route key missing from the cache through its module container
+        Args:
+            route_key: Route key
+        Returns:
+            RouteDataContainer: The container, now cached in _route_containers.
+        """
+        module_name = self._route_registry.get(route_key)
         if module_name is None:
             # Only fallback if route_key contains a dot
-            if '.' in route_key:
-                module_name = route_key.split('.')[0]
-            else:
+            module_name, dot, _ = route_key.partition('.')
+            if not dot:
                 # If no module can be determined, raise error
                 raise RuntimeError(f"Cannot determine module name for route: {route_key}")
 
         if module_name not in self._modules:
-            self._modules[module_name] = ModuleDataContainer(module_name)
+            self._modules[module_name] = ModuleDataContainer(module_name, self._orphaned)
 
         container = self._modules[module_name].get_route_container(route_key)
         self._route_containers[route_key] = container  # Cache for future access
@@ -416,7 +548,12 @@ class DataContainerManager:
         return self.get_container(route)
     
     def set_ui_instance(self, route: Union[str, Enum], instance: Any):
-        """Set UI instance for route container"""
+        """
+        Set UI instance for route container
+        Args:
+            route: Route key or Enum member
+            instance: UI instance to associate with the route container
+        """
         container = self.get_container(route)
         container.set_ui_instance(instance)
     
@@ -434,29 +571,51 @@ class DataContainerManager:
         """
         report = {}
         for module_name, module_container in self._modules.items():
-            report[module_name] = {}
-            for route_key in module_container.list_routes():
-                container = module_container.get_route_container(route_key)
-                report[module_name][route_key] = container.status.value
+            report[module_name] = module_report = {}
+            for route_key, container in module_container._routes.items():
+                module_report[route_key] = container.status.value
         return report
     
     def cleanup_orphaned(self):
-        """Clean up orphaned containers"""
-        for module_container in self._modules.values():
-            for route_key in module_container.list_routes():
-                container = module_container.get_route_container(route_key)
-                if container.status == ContainerStatus.ORPHANED:
-                    container.clear_data()
+        """
+        Clean up orphaned containers
+        Only the containers that queued themselves into this manager when their UI
+        instance was collected are visited; those that got a new UI instance (or
+        lost their data) since are left alone.
+        """
+        orphaned = self._orphaned
+        while orphaned:
+            container = orphaned.pop()
+            if container._status is ContainerStatus.ORPHANED:
+                container.clear_data()
     
     def save(self, file_path: str):
-        """Persist all container data to a JSON file"""
-        data = {}
-        for route_key, container in self._route_containers.items():
-            data[route_key] = {
-                k: v.value for k, v in container._data.items()
-            }
+        """
+        Persist all container data to a JSON file
+        The JSON is written route by route and entry by entry, so no intermediate
+        dict of the whole hierarchy is built.
+        Args:
+            file_path: Path of the JSON file to write
+        """
+        encode = json.JSONEncoder(ensure_ascii=False).encode
         with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+            write = f.write
+            write('{')
+            route_sep = '\n  '
+            for route_key, container in self._route_containers.items():
+                write(route_sep)
+                write(encode(route_key))
+                write(': {')
+                entry_sep = ''
+                for k, v in container._values.items():
+                    write(entry_sep)
+                    write(encode(k if type(k) is str else str(k)))
+                    write(': ')
+                    write(encode(v))
+                    entry_sep = ', '
+                write('}')
+                route_sep = ',\n  '
+            write('\n}\n')
         logger.info(f"Container data saved to {file_path}")
 
     def load(self, file_path: str):
@@ -465,9 +624,7 @@ class DataContainerManager:
             with open(file_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
             for route_key, values in data.items():
-                container = self.get_container(route_key)
-                for k, v in values.items():
-                    container.set_data(k, v)
+                self.get_container(route_key).update(values)
             logger.info(f"Container data loaded from {file_path}")
         except Exception as e:
             logger.error(f"Failed to load container data from {file_path}: {e}")
@@ -476,27 +633,33 @@ class DataContainerManager:
     @property
     def core(self) -> ModuleDataContainer:
         """Core module data container"""
-        return self._modules.get('core', ModuleDataContainer('core'))
+        return self._modules['core']
     
     @property
     def asset(self) -> ModuleDataContainer:
         """Asset module data container"""
-        return self._modules.get('asset', ModuleDataContainer('asset'))
+        return self._modules['asset']
     
     @property
     def data(self) -> ModuleDataContainer:
         """Data module data container"""
-        return self._modules.get('data', ModuleDataContainer('data'))
+        return self._modules['data']
     
     @property
     def report(self) -> ModuleDataContainer:
         """Report module data container"""
-        return self._modules.get('report', ModuleDataContainer('report'))
+        return self._modules['report']
     
     def __getattr__(self, name: str) -> ModuleDataContainer:
-        """Dynamic module access"""
+        """
+        Dynamic module access
+        Private and dunder names are never modules, so probes such as copy /
+        pickle / hasattr fail instead of creating a module container.
+        """
+        if name.startswith('_'):
+            raise AttributeError(name)
         if name not in self._modules:
-            self._modules[name] = ModuleDataContainer(name)
+            self._modules[name] = ModuleDataContainer(name, self._orphaned)
         return self._modules[name]
 
 # Global container manager instance
@@ -6,6 +6,9 @@ import logging
 from typing import Any, Type
 from functools import wraps
 
+# qxx libraries
+from .core import container_manager, _route_key_of
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,6 +55,19 @@ def auto_container(route_enum_or_key):
         ui_class._container_properties = container_properties
         ui_class._container_route = route_enum_or_key
         
+        # Resolve the route container now; keys without a module prefix can only
+        # be resolved once registered, their descriptors resolve on first access
+        try:
+            container = container_manager.get_container(route_enum_or_key)
+        except RuntimeError:
+            container = None
+        ui_class._container_bound = container
+        if container is not None:
+            route_key = _route_key_of(route_enum_or_key)
+            for attr in vars(ui_class).values():
+                if isinstance(attr, ContainerPropertyDescriptor) and attr.route_key == route_key:
+                    attr._container = container
+        
         logger.debug(f"Auto-container setup for {ui_class.__name__}: {list(container_properties.keys())}")
         
         return ui_class
@@ -69,17 +85,25 @@ class ContainerPropertyDescriptor:
         self.property_name = property_name
         self.data_type = data_type
         self.default = default
+        self._container = None
+    
+    def _resolve(self):
+        """
+        Look up the route container on first access and keep it
+        The manager never replaces the container of a route key once created,
+        so the cached one stays valid.
+        Returns:
+            The RouteDataContainer for route_key.
+        """
+        container = self._container = container_manager.get_container(self.route_key)
+        return container
     
     def __get__(self, obj, objtype=None):
         if obj is None:
             return self
-        
-        from .core import container_manager
-        
-        container = container_manager.get_container(self.route_key)
+        container = self._container or self._resolve()
         return container.get_data(self.property_name, self.default)
     
     def __set__(self, obj, value):
-        from .core import container_manager
-        container = container_manager.get_container(self.route_key)
+        container = self._container or self._resolve()
         container.set_data(self.property_name, value)
@@ -5,6 +5,9 @@ Navix Data Container Types - Type definitions for IDE support
 from typing import TypeVar, Generic, Any, Optional, Dict, List
 from abc import ABC, abstractmethod
 
+# qxx libraries
+from .core import container_manager
+
 T = TypeVar('T')
 
 class DataReference(Generic[T]):
@@ -18,17 +21,27 @@ class DataReference(Generic[T]):
         self._route_key = route_key
         self._property_name = property_name
         self._data_type = data_type
+        self._container = None
     
-    def get(self) -> Optional[T]:
+    def _resolve(self):
         """
-        Get typed value
+        Look up the route container on first access and keep it
         Returns:
-            Typed value from the data container
+            The RouteDataContainer for the route key.
         """
-        from .core import container_manager
         container = container_manager.get_container(self._route_key)
         if container is None:
             raise RuntimeError(f"Container not found for route: {self._route_key}")
+        self._container = container
+        return container
+    
+    def get(self) -> Optional[T]:
+        """
+        Get typed value
+        Returns:
+            Typed value from the data container
+        """
+        container = self._container or self._resolve()
         return container.get(self._property_name)
     
     def set(self, value: T):
@@ -37,10 +50,7 @@ class DataReference(Generic[T]):
         Args:
             value: Value to set in the data container
         """
-        from .core import container_manager
-        container = container_manager.get_container(self._route_key)
-        if container is None:
-            raise RuntimeError(f"Container not found for route: {self._route_key}")
+        container = self._container or self._resolve()
         container.set(self._property_name, value)
     
     @property
@@ -3,17 +3,15 @@ Navix Demo 01 - Basic Navigation
 Demonstrates: Enum-based routing, UI registration, navigation to main window with embedded child window.
 This example shows how to use Navix's navigation features to build a minimal main window application with an embedded child window.
 """
-import sys
-from pathlib import Path
-def setup_project_path():
-    project_root = Path(__file__).parent.parent.parent
-    if str(project_root) not in sys.path:
-        sys.path.insert(0, str(project_root))
-setup_project_path()
+try:
+    from . import _bootstrap  # noqa: F401  (run as a package module)
+except ImportError:
+    import _bootstrap  # noqa: F401  (run as a script)
 
 #======================================================================#
 from enum import Enum
-from Navix import navigate, UIVoyager, setup_navigator
+from functools import cache, partial
+from Navix import navigate, register_lazy, UIVoyager, setup_navigator
 
 # Import GUI framework
 # Note: PySide6 is used as an example.
@@ -21,8 +19,6 @@ from Navix import navigate, UIVoyager, setup_navigator
 from PySide6 import QtWidgets
 from PySide6 import QtCore
 
-voyager = None
-
 # Additional route enum
 # Route Enum definition
 # Best practice: Use descriptive names and consistent naming conventions (UPPERCASE with underscores).
@@ -43,8 +39,12 @@ class ExtraSimpleRoutes(Enum):
 #   metadata: Stores extra info (e.g., icon path, config).
 @navigate(SimpleRoutes.MAIN, singleton=True, title="Main Window")
 class MainWindow(QtWidgets.QWidget):
-    def __init__(self, **kwargs):
+    def __init__(self, voyager=None, **kwargs):
         super().__init__()
+        # The voyager is passed in through navigate_to(..., voyager=voyager) instead of a module global
+        self._voyager = voyager
+        # The embedded child window is created on the first click and reused afterwards
+        self._child = None
         self.setWindowTitle("Navix Simple Main Window")
         self.resize(300, 250)
         self.mainLayout = QtWidgets.QVBoxLayout(self)
@@ -62,20 +62,23 @@ class MainWindow(QtWidgets.QWidget):
         self.btn_dashboard = QtWidgets.QPushButton("Open Dashboard", self)
         self.btn_profile = QtWidgets.QPushButton("Open Profile", self)
         self.btn_help = QtWidgets.QPushButton("Open Help", self)
-        self.mainLayout.addWidget(self.label)
-        self.mainLayout.addWidget(self.childDock)
-        self.mainLayout.addWidget(self.btn)
-        self.mainLayout.addWidget(self.btn_dashboard)
-        self.mainLayout.addWidget(self.btn_profile)
-        self.mainLayout.addWidget(self.btn_help)
-        self.setLayout(self.mainLayout)
+        # All children exist at this point; add them in one pass. The layout is only
+        # computed once the window is shown, so this costs a single layout run.
+        for widget in (self.label, self.childDock, self.btn,
+                       self.btn_dashboard, self.btn_profile, self.btn_help):
+            self.mainLayout.addWidget(widget)
         self.btn.clicked.connect(self.open_child_window)
-        self.btn_dashboard.clicked.connect(self.open_dashboard)
-        self.btn_profile.clicked.connect(self.open_profile)
-        self.btn_help.clicked.connect(self.open_help)
+        # One slot for all windows, bound to its route per button
+        self.btn_dashboard.clicked.connect(partial(self._open, ExtraSimpleRoutes.DASHBOARD))
+        self.btn_profile.clicked.connect(partial(self._open, ExtraSimpleRoutes.PROFILE))
+        self.btn_help.clicked.connect(partial(self._open, ExtraSimpleRoutes.HELP))
 
     def open_child_window(self):
-        self.child_window = voyager.navigate_to(
+        if self._child is not None:
+            # Toggle the existing child instead of stacking another one into the dock
+            self._child.setVisible(not self._child.isVisible())
+            return
+        self._child = self._voyager.navigate_to(
             SimpleRoutes.CHILD,
             parent=self.childDock,
             window_title="Positioned Child Window",
@@ -83,29 +86,19 @@ class MainWindow(QtWidgets.QWidget):
             parent_layout=self.childDock_layout,
             margin=(5, 5, 5, 5),
         )
-        if self.child_window:
+        if self._child:
             # If voyager returns a wrapper, use .native_widget; otherwise, use the instance directly.
             #  wrapper:
-            #  widget = getattr(self.child_window, "native_widget", self.child_window)
+            #  widget = getattr(self._child, "native_widget", self._child)
             #  self.childDock_layout.addWidget(widget)
-            self.childDock_layout.addWidget(self.child_window)
-
-    def open_dashboard(self):
-        win = voyager.navigate_to(ExtraSimpleRoutes.DASHBOARD)
-        if win:
-            win.show()
+            self.childDock_layout.addWidget(self._child)
 
-    def open_profile(self):
-        win = voyager.navigate_to(ExtraSimpleRoutes.PROFILE)
+    def _open(self, route):
+        win = self._voyager.navigate_to(route)
         if win:
             win.show()
 
-    def open_help(self):
-        win = voyager.navigate_to(ExtraSimpleRoutes.HELP)
-        if win:
-            win.show()
-
-@navigate(SimpleRoutes.CHILD, title="Child Window")
+@navigate(SimpleRoutes.CHILD, singleton=True, title="Child Window")
 class ChildWindow(QtWidgets.QFrame):
     def __init__(self, parent=None, 
                  window_title=None, custom_data=None, parent_layout=None, margin=None, **kwargs):
@@ -122,41 +115,27 @@ class ChildWindow(QtWidgets.QFrame):
             parent_layout.setContentsMargins(margin[0], margin[1], margin[2], margin[3])
         self.label = QtWidgets.QLabel("This is a child window", self)
         self.main_layout.addWidget(self.label)
-        self.setLayout(self.main_layout)
 
 # ExtraSimpleRoutes corresponding UI
-@navigate(ExtraSimpleRoutes.DASHBOARD, title="Dashboard")
-class DashboardWindow(QtWidgets.QWidget):
-    def __init__(self, **kwargs):
-        super().__init__()
-        self.setWindowTitle("Dashboard")
-        self.resize(300, 180)
-        label = QtWidgets.QLabel("This is the dashboard window", self)
-        layout = QtWidgets.QVBoxLayout(self)
-        layout.addWidget(label)
-        self.setLayout(layout)
+# The metadata given to @navigate (here: title) is passed to the constructor on navigation,
+# so a single class serves all three routes that only differ in their title.
+# register_lazy(...) registers a route without building its class: the factory runs
+# the first time one of the routes is navigated to (cached, so the class is built once).
+@cache
+def _build_info_window():
+    class InfoWindow(QtWidgets.QWidget):
+        def __init__(self, title="Info", **kwargs):
+            super().__init__()
+            self.setWindowTitle(title)
+            self.resize(300, 180)
+            label = QtWidgets.QLabel(f"This is the {title.lower()} window", self)
+            layout = QtWidgets.QVBoxLayout(self)
+            layout.addWidget(label)
+    return InfoWindow
 
-@navigate(ExtraSimpleRoutes.PROFILE, title="Profile")
-class ProfileWindow(QtWidgets.QWidget):
-    def __init__(self, **kwargs):
-        super().__init__()
-        self.setWindowTitle("Profile")
-        self.resize(300, 180)
-        label = QtWidgets.QLabel("This is the profile window", self)
-        layout = QtWidgets.QVBoxLayout(self)
-        layout.addWidget(label)
-        self.setLayout(layout)
-
-@navigate(ExtraSimpleRoutes.HELP, title="Help")
-class HelpWindow(QtWidgets.QWidget):
-    def __init__(self, **kwargs):
-        super().__init__()
-        self.setWindowTitle("Help")
-        self.resize(300, 180)
-        label = QtWidgets.QLabel("This is the help window", self)
-        layout = QtWidgets.QVBoxLayout(self)
-        layout.addWidget(label)
-        self.setLayout(layout)
+register_lazy(ExtraSimpleRoutes.DASHBOARD, _build_info_window, title="Dashboard")
+register_lazy(ExtraSimpleRoutes.PROFILE, _build_info_window, title="Profile")
+register_lazy(ExtraSimpleRoutes.HELP, _build_info_window, title="Help")
 
 def main():
     """
@@ -169,14 +148,13 @@ def main():
     - setup_navigator: Registers all routes from an Enum for global management and validation.
     - navigate_to: Navigates to a registered UI.
     """
-    global voyager 
     setup_navigator(SimpleRoutes)
     setup_navigator(ExtraSimpleRoutes)
     app     = QtWidgets.QApplication([])
     # Initialize UIVoyager
     voyager = UIVoyager()
     # Navigate to the main window
-    win     = voyager.navigate_to(SimpleRoutes.MAIN)
+    win     = voyager.navigate_to(SimpleRoutes.MAIN, voyager=voyager)
     win.show()
     app.exec()
 
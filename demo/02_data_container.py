@@ -10,16 +10,14 @@ but if you do not, you must manually manage the lifecycle and data flow of conta
 """
 #======================================================================#
 # intentionally left blank to ensure proper module structure
-import sys
-from pathlib import Path
-def setup_project_path():
-    project_root = Path(__file__).parent.parent.parent
-    if str(project_root) not in sys.path:
-        sys.path.insert(0, str(project_root))
-setup_project_path()
+try:
+    from . import _bootstrap  # noqa: F401  (run as a package module)
+except ImportError:
+    import _bootstrap  # noqa: F401  (run as a script)
 #======================================================================#
 # Import necessary modules
 from enum import Enum
+import logging
 from Navix import  navigate, container_manager, container_property, setup_navigator
 
 # Import GUI framework
@@ -28,6 +26,8 @@ from Navix import  navigate, container_manager, container_property, setup_naviga
 from PySide6 import QtWidgets
 from PySide6.QtCore import QTimer
 
+log = logging.getLogger(__name__)
+
 #= Enum for routes =#
 class DataRoutes(Enum):
     MAIN     = "data.main"
@@ -58,48 +58,53 @@ class SettingsDialog(QtWidgets.QDialog):
         # Save theme setting to global container
         container_manager(DataRoutes.SETTINGS).set('theme', self.edit.text())
         # Demonstrate container methods
+        # Look the container up once and reuse it; "data.main" and DataRoutes.MAIN name the same container
+        main = container_manager.get_container(DataRoutes.MAIN)
 
+        # The results are collected and logged once at the end (formatted only if INFO is enabled)
         # 1. List all keys in the container
-        keys = container_manager("data.main").list_keys()
-        print(f"container keys: {keys}")
+        keys = main.list_keys()
 
         # 2. Get data from the container
-        sturctured_data = container_manager("data.main").get("maintheme1", [])
-        print(f"structured data: {sturctured_data}")
-        sturctured_data2 = container_manager("data.main").get("maintheme2", [])
-        print(f"structured data2: {sturctured_data2}")
+        sturctured_data = main.get("maintheme1", [])
+        sturctured_data2 = main.get("maintheme2", [])
 
-        # 3. Set/create data in the container
-        container_manager.get_container(DataRoutes.MAIN).set("maintheme3", {"key1": "value1", "key2": "value2"})
-        print(f"container data: {container_manager.get_container(DataRoutes.MAIN).get('maintheme3', {})}")
+        # 3. Set/create data in the container (single values: main.set(key, value))
+        # update() writes several entries in one call
+        main.update({"maintheme3": {"key1": "value1", "key2": "value2"}, "maintheme4": "draft"})
+        created = (main.get('maintheme3', {}), main.get('maintheme4'))
 
         # 4. Update data in the container
-        container_manager.get_container(DataRoutes.MAIN).update({"maintheme3": {"key1": "new_value1", "key2": "new_value2"}})
-        print(f"updated container data: {container_manager.get_container(DataRoutes.MAIN).get('maintheme3', {})}")
+        main.update({"maintheme3": {"key1": "new_value1", "key2": "new_value2"}})
+        updated = main.get('maintheme3', {})
 
-        # 5. Clear data in the container
-        container_manager.get_container(DataRoutes.MAIN).clear("maintheme3")
-        print(f"cleared container data: {container_manager.get_container(DataRoutes.MAIN).get('maintheme3', {})}")
+        # 5. Clear data in the container; a list of keys clears them in one call
+        main.clear(["maintheme3", "maintheme4"])
+        cleared = (main.get('maintheme3', {}), main.get('maintheme4'))
 
         # 6. Get container status report
         rep = container_manager.get_status_report()
-        print(f"container status report: {rep}")
 
         # 7. Get all data in the container
-        all_data = container_manager.get_container(DataRoutes.MAIN).items()
-        print(f"all container data: {all_data}")
+        all_data = main.items()
 
         # 8. List all modules in the container manager
         all_mod = container_manager.list_all_modules()
-        print(f"all container modules: {all_mod}")
 
         # 9. List all registered routes
         all_routes = container_manager.list_all_routes()
-        print(f"all container routes: {all_routes}")
 
         # 10. List all container instances
         all_containers = container_manager.list_all_containers()
-        print(f"all container instances: {all_containers}")
+
+        log.debug(
+            "container keys: %s\nstructured data: %s\nstructured data2: %s\n"
+            "container data: %s\nupdated container data: %s\ncleared container data: %s\n"
+            "container status report: %s\nall container data: %s\nall container modules: %s\n"
+            "all container routes: %s\nall container instances: %s",
+            keys, sturctured_data, sturctured_data2, created, updated, cleared,
+            rep, all_data, all_mod, all_routes, all_containers,
+        )
         # To clear all data in the container:
         # container_manager.get_container(DataRoutes.MAIN).clear_data()
         # print(f"cleared all container data: {container_manager.get_container(DataRoutes.MAIN).list_keys()}")
@@ -115,9 +120,17 @@ class MainWindow(QtWidgets.QWidget):
         btn = QtWidgets.QPushButton("open settings", self)
         btn.move(100, 60)
         btn.clicked.connect(self.open_settings)
+        # The settings dialog is built on first use and reused for later clicks
+        self._settings_dlg = None
         self.time_label = QtWidgets.QLabel("current time:", self)
         self.time_label.setGeometry(200, 100, 200, 30)
-        self.timeChecker()
+        self._last_theme = None
+        self._on_tick()
+        # One long-lived timer parented to the window, instead of re-arming a single shot every tick
+        self._tick = QTimer(self)
+        self._tick.setInterval(500)
+        self._tick.timeout.connect(self._on_tick)
+        self._tick.start()
 
         # You can use either the route enum or string to access container properties
         # The container is structured and can store complex data structures
@@ -130,16 +143,21 @@ class MainWindow(QtWidgets.QWidget):
         # 'theme' is the property name, 'dark' is the default value
         # You can modify this value in the settings dialog
         container_manager(DataRoutes.SETTINGS).set("theme", "dark")
-        dlg = SettingsDialog()
-        dlg.exec()
-
-    def timeChecker(self):
+        if self._settings_dlg is None:
+            self._settings_dlg = SettingsDialog()
+        else:
+            # Refresh the reused dialog from the container
+            self._settings_dlg.edit.setText(container_manager(DataRoutes.SETTINGS).get('theme'))
+        self._settings_dlg.exec()
+
+    def _on_tick(self):
         # Get current time and update label
         # Here we read the theme setting from the container
+        # Only touch the label when the value changed, to avoid needless repaints
         theme = container_manager(DataRoutes.SETTINGS).get('theme', 'waiting')
-        self.time_label.setText(theme)
-        # Update every second
-        QTimer.singleShot(500, self.timeChecker)
+        if theme != self._last_theme:
+            self._last_theme = theme
+            self.time_label.setText(theme)
 
 def main():
     # Setup navigator
@@ -4,7 +4,8 @@ Navix Example 03 - Validation & Security
 
 # 1. **Route Validation**
 #    - Navix supports validating route names using regular expressions to prevent typos or unregistered routes.
-#    - You can use `voyager.add_route_pattern(r'^secure\.[a-z_]+$')` to add valid route rules.
+#    - You can use `voyager.add_route_pattern(r'^secure\.[a-z_]+$')` to add valid route rules
+#      (a pattern compiled with `re.compile` is accepted as well).
 #    - When navigating (`navigate_to`), Navix checks if the route matches these rules; if not, it raises an exception.
 
 # 2. **Parameter Validation**
@@ -38,17 +39,15 @@ Navix Example 03 - Validation & Security
 
 # # This enables enterprise-grade navigation security and data validation in your application!
 """
-import sys
-from pathlib import Path
-def setup_project_path():
-    project_root = Path(__file__).parent.parent.parent
-    if str(project_root) not in sys.path:
-        sys.path.insert(0, str(project_root))
-setup_project_path()
+try:
+    from . import _bootstrap  # noqa: F401  (run as a package module)
+except ImportError:
+    import _bootstrap  # noqa: F401  (run as a script)
 
 #======================================================================#
 from enum import Enum
 import logging
+import re
 from Navix import navigate, UIVoyager, setup_navigator,security_validator
 # Import GUI framework
 # Note: PySide6 is used as an example.
@@ -62,6 +61,10 @@ class SecureRoutes(Enum):
     MAIN  = "secure.main"
     ADMIN = "secure.admin"
 
+# Shared parameter rule: one module-level function instead of a lambda per rule
+def _nonempty_str(value) -> bool:
+    return type(value) is str and value != ""
+
 @navigate(SecureRoutes.MAIN)
 class MainWindow(QtWidgets.QWidget):
     def __init__(self, address=None, user_id=None, **kwargs):
@@ -124,12 +127,12 @@ def main():
 
     # Add route validation rule
     # Best practice: Use regex patterns to enforce naming conventions and prevent typos.
-    voyager.add_route_pattern(r'^secure\.[a-z_]+$')
+    voyager.add_route_pattern(re.compile(r'^secure\.[a-z_]+$'))
    
     # Add parameter validation rules
-    voyager.add_parameter_rule('address', lambda x: isinstance(x, str) and len(x) > 0)
-    voyager.add_parameter_rule('user_id', lambda x: isinstance(x, str) and len(x) > 0)
-    voyager.add_parameter_rule('datetime', lambda x: isinstance(x, str) and len(x) > 0)
+    voyager.add_parameter_rule('address', _nonempty_str)
+    voyager.add_parameter_rule('user_id', _nonempty_str)
+    voyager.add_parameter_rule('datetime', _nonempty_str)
   
     # ----------- Method 1: Automatic security validation (recommended) -----------
     # Key: Specify security parameter validation
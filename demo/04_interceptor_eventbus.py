@@ -12,16 +12,14 @@ This example demonstrates the interceptor mechanism and navigation event bus (pu
 When running this demo, attempting to navigate to the blocked window will be intercepted and trigger the navigation_failed event (you can show a popup or log in on_navigation_failed).
 This file is suitable for learning and referencing Navix's interceptor and event bus extension mechanisms.
 """
-import sys
-from pathlib import Path
-def setup_project_path():
-    project_root = Path(__file__).parent.parent.parent
-    if str(project_root) not in sys.path:
-        sys.path.insert(0, str(project_root))
-setup_project_path()
+try:
+    from . import _bootstrap  # noqa: F401  (run as a package module)
+except ImportError:
+    import _bootstrap  # noqa: F401  (run as a script)
 
 #======================================================================#
 from enum import Enum
+import logging
 from Navix import navigate, UIVoyager, setup_navigator
 from Navix.routing import RouteCatalog
 from Navix.navigation import navigation_event_bus
@@ -49,23 +47,29 @@ class BlockedWindow(QtWidgets.QWidget):
         self.setWindowTitle("blocked window")
         self.resize(320, 160)
 
+# Route keys the interceptor blocks; add more routes here without touching the interceptor
+_BLOCKED = frozenset({EventRoutes.BLOCKED.value})
+
 def block_interceptor(route, params):
     # block the BLOCKED route
     # This interceptor will prevent navigation to the BLOCKED route
-    if route == EventRoutes.BLOCKED.value:
-        return False
-    return True
+    # (interceptors receive the route key string, not the Enum member)
+    return route not in _BLOCKED
+
+# Bound once; messages are only formatted when the INFO level is enabled
+log = logging.getLogger("navix.eventbus").info
 
 def on_before_navigate(route, params, **_):
-    print(f"[EventBus] will navigate to: {route}, with params: {params}")
+    log("[EventBus] will navigate to: %s, with params: %s", route, params)
 
 def on_navigation_failed(route, params, error, **_):
-    print(f"[EventBus] navigation failed: {route}, error: {error}")
+    log("[EventBus] navigation failed: %s, error: %s", route, error)
     # show a popup or log the error
     #parent = QtWidgets.QApplication.activeWindow()
     #QtWidgets.QMessageBox.warning(parent, "Interceptor", f"Navigation to {route} was intercepted or failed.\nError: {error}")
 
 def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     setup_navigator(EventRoutes)
     app     = QtWidgets.QApplication([])
     voyager = UIVoyager()
@@ -73,9 +77,11 @@ def main():
     # Register the interceptor
     RouteCatalog.add_interceptor(block_interceptor)
     # Subscribe to navigation events
-    navigation_event_bus.subscribe("before_navigate", on_before_navigate)
+    # weak=True: the bus only holds a weak reference, so subscribing e.g. a widget's
+    # bound method does not keep the widget alive after it is closed
+    navigation_event_bus.subscribe("before_navigate", on_before_navigate, weak=True)
     # Subscribe to navigation failed event
-    navigation_event_bus.subscribe("navigation_failed", on_navigation_failed)
+    navigation_event_bus.subscribe("navigation_failed", on_navigation_failed, weak=True)
 
     win = voyager.navigate_to(EventRoutes.MAIN)
     win.show()
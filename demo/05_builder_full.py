@@ -85,13 +85,10 @@ This example covers all major features of the Navix builder API. You can comment
 """
 
 #======================================================================#
-import sys
-from pathlib import Path
-def setup_project_path():
-    project_root = Path(__file__).parent.parent.parent
-    if str(project_root) not in sys.path:
-        sys.path.insert(0, str(project_root))
-setup_project_path()
+try:
+    from . import _bootstrap  # noqa: F401  (run as a package module)
+except ImportError:
+    import _bootstrap  # noqa: F401  (run as a script)
 
 from Navix.builders import Navix_app 
 from Navix import navigate, setup_navigator
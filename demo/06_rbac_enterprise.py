@@ -19,13 +19,10 @@ Difference from 03_validation_security.py:
 
 This example shows how to integrate RBAC into Navix navigation Python desktop applications.
 """
-import sys
-from pathlib import Path
-def setup_project_path():
-    project_root = Path(__file__).parent.parent.parent
-    if str(project_root) not in sys.path:
-        sys.path.insert(0, str(project_root))
-setup_project_path()
+try:
+    from . import _bootstrap  # noqa: F401  (run as a package module)
+except ImportError:
+    import _bootstrap  # noqa: F401  (run as a script)
 #======================================================================#
 from enum import Enum
 from Navix import navigate, UIVoyager, setup_navigator
@@ -9,13 +9,10 @@ This example demonstrates:
 
 You can run this demo with different GUI frameworks installed to see automatic detection and adaptation.
 """
-import sys
-from pathlib import Path
-def setup_project_path():
-    project_root = Path(__file__).parent.parent.parent
-    if str(project_root) not in sys.path:
-        sys.path.insert(0, str(project_root))
-setup_project_path()
+try:
+    from . import _bootstrap  # noqa: F401  (run as a package module)
+except ImportError:
+    import _bootstrap  # noqa: F401  (run as a script)
 #======================================================================#
 
 from Navix.adapters import GUIAdapter, WidgetWrapper, FrameworkDetector
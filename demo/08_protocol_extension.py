@@ -37,13 +37,10 @@ Best Practice:
 This is how you build truly professional, extensible Python desktop applications with Navix.
 """
 
-import sys
-from pathlib import Path
-def setup_project_path():
-    project_root = Path(__file__).parent.parent.parent
-    if str(project_root) not in sys.path:
-        sys.path.insert(0, str(project_root))
-setup_project_path()
+try:
+    from . import _bootstrap  # noqa: F401  (run as a package module)
+except ImportError:
+    import _bootstrap  # noqa: F401  (run as a script)
 #======================================================================#
 
 from Navix.interfaces import INavigationInterceptor, IRouteValidator, IWidgetWrapper
@@ -4,13 +4,10 @@ Demonstrates: Declaring type-safe container properties for IDE completion and do
 Shows how to use @container_property for structured, documented, and type-hinted data sharing.
 """
 
-import sys
-from pathlib import Path
-def setup_project_path():
-    project_root = Path(__file__).parent.parent.parent
-    if str(project_root) not in sys.path:
-        sys.path.insert(0, str(project_root))
-setup_project_path()
+try:
+    from . import _bootstrap  # noqa: F401  (run as a package module)
+except ImportError:
+    import _bootstrap  # noqa: F401  (run as a script)
 
 from enum import Enum
 from Navix import container_manager, container_property, navigate, setup_navigator
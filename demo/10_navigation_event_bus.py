@@ -4,10 +4,10 @@ Navix Demo 10 - Navigation Event Bus Full Example
 Demonstrates full usage of subscribe, unsubscribe, and publish.
 """
 import sys
-from pathlib import Path
-project_root = Path(__file__).parent.parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+try:
+    from . import _bootstrap  # noqa: F401  (run as a package module)
+except ImportError:
+    import _bootstrap  # noqa: F401  (run as a script)
 #======================================================================#
 
 from enum import Enum
@@ -4,13 +4,10 @@ Navix Demo 16 - Navigation History & Back Example
 Demonstrates navigation history tracking and back navigation in UIVoyager.
 """
 
-import sys
-from pathlib import Path
-def setup_project_path():
-    project_root = Path(__file__).parent.parent.parent
-    if str(project_root) not in sys.path:
-        sys.path.insert(0, str(project_root))
-setup_project_path()
+try:
+    from . import _bootstrap  # noqa: F401  (run as a package module)
+except ImportError:
+    import _bootstrap  # noqa: F401  (run as a script)
 
 #======================================================================#
 from Navix import UIVoyager, navigate, setup_navigator
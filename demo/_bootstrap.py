@@ -0,0 +1,13 @@
+"""
+Navix Demo Bootstrap - puts the project root on sys.path for the demo scripts
+Imported by every demo before `import Navix`; the path is computed once per process.
+"""
+# standard library imports
+import sys
+from pathlib import Path
+
+# the directory containing the Navix package
+_ROOT = str(Path(__file__).absolute().parents[2])
+
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
@@ -3,29 +3,49 @@ Navix Navigation Event Bus - Publish/Subscribe for navigation events
 ==================================================================
 Provides a simple event bus for navigation lifecycle events.
 """
-
-from typing import Callable, Dict, List, Any
+# standard library imports
+import weakref
+from typing import Callable, Dict, List, Any, Union
 
 
 class NavigationEventBus:
     """
     widget event bus for navigation events
     This class implements a simple publish/subscribe pattern for navigation events.
-    
+    Handlers subscribed with weak=True are held through a weak reference (WeakMethod
+    for bound methods) and dropped once collected, so a subscription does not keep
+    e.g. a closed widget alive.
     """
     def __init__(self):
-        self._subscribers: Dict[str, List[Callable[..., None]]] = {}
+        # handlers, or weak references to them for weak subscriptions
+        self._subscribers: Dict[str, List[Union[Callable[..., None], weakref.ref]]] = {}
 
-    def subscribe(self, event: str, handler: Callable[..., None]):
+    def subscribe(self, event: str, handler: Callable[..., None], weak: bool = False):
         """
         Subscribe a handler to a navigation event
         Args:
             event: The event name to subscribe to.
             handler: The function to call when the event is published.
-
+            weak: Only keep a weak reference to the handler; it is unsubscribed when collected.
         """
+        if weak:
+            discard = lambda ref, event=event: self._discard(event, ref)
+            if getattr(handler, '__self__', None) is not None:
+                handler = weakref.WeakMethod(handler, discard)
+            else:
+                handler = weakref.ref(handler, discard)
         self._subscribers.setdefault(event, []).append(handler)
 
+    def _discard(self, event: str, ref: weakref.ref):
+        """
+        Drop the weak subscription of a collected handler
+        Args:
+            event: The event name the handler was subscribed to.
+            ref: The dead weak reference.
+        """
+        if event in self._subscribers:
+            self._subscribers[event] = [h for h in self._subscribers[event] if h is not ref]
+
     def unsubscribe(self, event: str, handler: Callable[..., None]):
         """
         Unsubscribe a handler from a navigation event
@@ -35,7 +55,8 @@ class NavigationEventBus:
         """
         if event in self._subscribers:
             self._subscribers[event] = [
-                h for h in self._subscribers[event] if h != handler
+                h for h in self._subscribers[event]
+                if (h() if isinstance(h, weakref.ref) else h) != handler
             ]
 
     def publish(self, event: str, **kwargs):
@@ -47,6 +68,10 @@ class NavigationEventBus:
         
         """
         for handler in self._subscribers.get(event, []):
+            if isinstance(handler, weakref.ref):
+                handler = handler()
+                if handler is None:
+                    continue
             try:
                 handler(**kwargs)
             except Exception:
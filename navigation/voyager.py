@@ -3,7 +3,7 @@
 UI Voyager: Professional UI Navigation System
 """
 # standard library imports
-from   typing import Dict, Optional, Any, Union, List
+from   typing import Dict, Optional, Any, Union, List, Pattern
 from   enum import Enum
 import logging
 
@@ -356,11 +356,11 @@ class UIVoyager(IUILifecycleManager):
         self._enable_security = enable_security
         logger.info(f"Validation configured: validation={enable_validation}, security={enable_security}")
     
-    def add_route_pattern(self, pattern: str):
+    def add_route_pattern(self, pattern: Union[str, Pattern]):
         """
         add route naming pattern
         Args:
-            pattern: Regular expression pattern for route validation.
+            pattern: Regular expression pattern for route validation, as a string or a compiled re.Pattern.
         """
         route_validator.add_route_pattern(pattern)
     
@@ -69,18 +69,51 @@ class RouteCatalog(IRouteRegistry):
             singleton: whether to enforce a single instance for this route
             meta: additional metadata for the navigator
         """
+        cls._add_route(route, ui_class, None, lazy, singleton, meta)
+    
+    @classmethod
+    def register_factory(cls, route: Union[str, Enum], factory: Callable[[], Type],
+                         lazy: bool = True, singleton: bool = False, **meta):
+        """
+        register a navigator whose UI class is built on first lookup
+        Args:
+            route: route name or Enum member
+            factory: zero-argument callable returning the UI class; called by
+                     get_navigator_info the first time the route is looked up
+            lazy: whether to create the UI instance lazily
+            singleton: whether to enforce a single instance for this route
+            meta: additional metadata for the navigator
+        """
+        cls._add_route(route, None, factory, lazy, singleton, meta)
+    
+    @classmethod
+    def _add_route(cls, route: Union[str, Enum], ui_class: Optional[Type],
+                   factory: Optional[Callable[[], Type]], lazy: bool, singleton: bool,
+                   meta: Dict[str, Any]):
+        """
+        store a navigator entry, rejecting routes that are already registered
+        Args:
+            route: route name or Enum member
+            ui_class: class of the UI component, or None for a factory entry
+            factory: callable building the UI class, or None for a class entry
+            lazy: whether to create the UI instance lazily
+            singleton: whether to enforce a single instance for this route
+            meta: additional metadata for the navigator
+        """
         route_key = route.value if isinstance(route, Enum) else route
         
         # check if route is already registered
         if route_key in cls._routes:
-            existing_class = cls._routes[route_key]['ui_class']
+            existing = cls._routes[route_key]
+            existing_name = (existing['ui_class'] or existing['factory']).__name__
             raise RouteConflictError(
-                f"Route '{route_key}' already registered with {existing_class.__name__}"
+                f"Route '{route_key}' already registered with {existing_name}"
             )
         
         cls._routes[route_key] = {
             'ui_class': ui_class,
-            'module': ui_class.__module__,
+            'factory': factory,
+            'module': (ui_class or factory).__module__,
             'lazy': lazy,
             'singleton': singleton,
             'meta': meta
@@ -100,6 +133,9 @@ class RouteCatalog(IRouteRegistry):
         info = cls._routes.get(route_key)
         if not info:
             logger.warning(f"Navigator not found for route: {route_key}")
+        elif info['ui_class'] is None:
+            # build the class of a factory-registered route on first use
+            info['ui_class'] = info['factory']()
         return info
     
     def register_route(self, route: str, handler: type, **meta) -> None:
@@ -168,13 +204,22 @@ class RouteCatalog(IRouteRegistry):
         return cls._interceptors.copy()
     
     @classmethod
-    def list_navigators(cls) -> Dict[str, Dict[str, Any]]:
+    def list_navigators(cls, resolve: bool = False) -> Dict[str, Dict[str, Any]]:
         """
         list all registered navigators
+        Args:
+            resolve: build the UI class of factory entries that were not looked up yet;
+                     otherwise such entries keep 'ui_class' None and are flagged 'built': False
         Returns:
             A dictionary mapping route names to their navigator information.
         """
-        return cls._routes.copy()
+        if resolve:
+            for route_key in cls._routes:
+                cls.get_navigator_info(route_key)
+        return {
+            route_key: {**info, 'built': info['ui_class'] is not None}
+            for route_key, info in cls._routes.items()
+        }
     
     @classmethod
     def discover_navigators(cls, base_package: str, pattern: str = "*.py"):
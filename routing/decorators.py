@@ -1,5 +1,5 @@
 # stand libraries
-from typing import  Union, Type
+from typing import  Union, Type, Callable
 from enum import Enum
 import logging
 logger = logging.getLogger(__name__)
@@ -30,6 +30,23 @@ def navigate(route: Union[str, Enum], **meta):
             raise
     return decorator
 
+def register_lazy(route: Union[str, Enum], factory: Callable[[], Type], **meta) -> None:
+    """
+    register a route whose UI class is only built on first navigation
+        register_lazy(Routes.HELP, _build_help_window, title="Help")
+    Args:
+        route: route name or Enum member
+        factory: zero-argument callable returning the UI class
+        meta: additional metadata for the navigator
+    """
+    try:
+        RouteCatalog.register_factory(route, factory, **meta)
+        from ..data_container import container_manager 
+        container_manager.register_route(route)
+    except RouteConflictError as e:
+        logger.error(f"Failed to register navigator: {e}")
+        raise
+
 def setup_navigator(route_enum: Type[Enum]):
     """
     setup route enum
@@ -8,9 +8,6 @@ import re
 from typing import Dict, Any, List, Pattern, Callable, Optional
 import logging
 
-# qxx libraries
-from ..security.rbac import rbac_manager
-
 logger = logging.getLogger(__name__)
 
 class SecurityValidator:
@@ -75,7 +72,7 @@ class SecurityValidator:
         
         # Check module whitelist
         if self._allowed_modules:
-            module = route.split('.')[0]
+            module = route.partition('.')[0]
             if module not in self._allowed_modules:
                 logger.warning(f"Security: Module not in whitelist: {module}")
                 return False
@@ -87,6 +84,8 @@ class SecurityValidator:
         
         # RBAC only runs if no custom checker is set
         if user_context and 'user_id' in user_context:
+            # imported on first use so apps without RBAC never load it
+            from ..security.rbac import rbac_manager
             user_id = user_context['user_id']  # <-- This is a custom string, typically your application's user identifier.
             if not rbac_manager.is_allowed(user_id, route):
                 logger.warning(f"Security: RBAC denied user {user_id} for route {route}")
@@ -5,7 +5,7 @@ Professional validation system for routes and parameters
 """
 # standard library imports
 import re
-from typing import Dict, Any, Union, List, Pattern, Callable, Optional
+from typing import Dict, Any, Union, List, Tuple, Pattern, Callable, Optional
 from enum import Enum
 import logging
 
@@ -14,6 +14,29 @@ from ..interfaces import IRouteValidator
 
 logger = logging.getLogger(__name__)
 
+def _combine_patterns(patterns: List[Pattern]) -> Optional[Callable[[str], Any]]:
+    """
+    join route patterns into a single alternation regex
+    Args:
+        patterns: The compiled route patterns.
+    Returns:
+        The bound match method of the combined regex, or None when the patterns
+        cannot be joined safely and must be tried one by one: flags, or capturing
+        groups, whose back-references and conditionals would be renumbered.
+    """
+    if not patterns:
+        return None
+    for pattern in patterns:
+        if pattern.flags != re.UNICODE or pattern.groups:
+            return None
+    try:
+        return re.compile('|'.join(f'(?:{pattern.pattern})' for pattern in patterns)).match
+    except re.error:
+        return None
+
+# marks a value not there yet: a rule parameter that was not passed, or an unbuilt route matcher
+_MISSING = object()
+
 class RouteValidationError(Exception):
     """Route validation specific exception"""
     pass
@@ -27,7 +50,11 @@ class RouteValidator(IRouteValidator):
     
     def __init__(self):
         self._route_patterns: List[Pattern] = []
+        # combined match method, built by validate_route; _MISSING after the patterns changed
+        self._route_matcher: Optional[Callable[[str], Any]] = None
         self._parameter_rules: Dict[str, Callable] = {}
+        # (param_name, validator) pairs iterated by validate_params
+        self._parameter_checks: Tuple[Tuple[str, Callable], ...] = ()
         self._reserved_routes: set = set()
         self._setup_default_rules()
     
@@ -45,13 +72,14 @@ class RouteValidator(IRouteValidator):
             'system.unauthorized'
         ])
     
-    def add_route_pattern(self, pattern: str):
+    def add_route_pattern(self, pattern: Union[str, Pattern]):
         """
         Add route naming pattern
         Args:
-            pattern: Regular expression pattern for route names
+            pattern: Regular expression pattern for route names, as a string or already compiled
         """
-        self._route_patterns.append(re.compile(pattern))
+        self._route_patterns.append(pattern if pattern.__class__ is re.Pattern else re.compile(pattern))
+        self._route_matcher = _MISSING
     
     def add_parameter_rule(self, param_name: str, validator: Callable[[Any], bool]):
         """
@@ -63,6 +91,7 @@ class RouteValidator(IRouteValidator):
             None
         """
         self._parameter_rules[param_name] = validator
+        self._parameter_checks = tuple(self._parameter_rules.items())
     
     def validate_route(self, route: Union[str, Enum]) -> bool:
         """
@@ -78,8 +107,15 @@ class RouteValidator(IRouteValidator):
         if route_str in self._reserved_routes:
             raise RouteValidationError(f"Route '{route_str}' is reserved for system use")
         
-        # Check naming patterns
-        if not any(pattern.match(route_str) for pattern in self._route_patterns):
+        # Check naming patterns, in one regex call when they could be combined
+        matcher = self._route_matcher
+        if matcher is _MISSING:
+            matcher = self._route_matcher = _combine_patterns(self._route_patterns)
+        if matcher is not None:
+            matched = matcher(route_str) is not None
+        else:
+            matched = any(pattern.match(route_str) for pattern in self._route_patterns)
+        if not matched:
             raise RouteValidationError(f"Route '{route_str}' doesn't match naming conventions")
         
         return True
@@ -92,13 +128,15 @@ class RouteValidator(IRouteValidator):
         Returns:
             True if all parameters are valid, raises ParameterValidationError if not
         """
-        for param_name, param_value in params.items():
-            if param_name in self._parameter_rules:
-                validator = self._parameter_rules[param_name]
-                if not validator(param_value):
-                    raise ParameterValidationError(
-                        f"Parameter '{param_name}' validation failed for value: {param_value}"
-                    )
+        if not params:
+            return True
+        get = params.get
+        for param_name, validator in self._parameter_checks:
+            param_value = get(param_name, _MISSING)
+            if param_value is not _MISSING and not validator(param_value):
+                raise ParameterValidationError(
+                    f"Parameter '{param_name}' validation failed for value: {param_value}"
+                )
         return True
     
     